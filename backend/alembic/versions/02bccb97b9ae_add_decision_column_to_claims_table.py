@@ -6,10 +6,12 @@ Create Date: 2025-12-22 10:36:30.136152
 
 """
 from typing import Sequence, Union
+import logging
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+logger = logging.getLogger("alembic.runtime.migration")
 
 
 # revision identifiers, used by Alembic.
@@ -21,28 +23,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add decision column to claims table."""
-    # Check if column already exists
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [col['name'] for col in inspector.get_columns('claims')]
-    
-    if 'decision' not in columns:
-        # Add decision column as nullable VARCHAR
-        op.add_column('claims', sa.Column('decision', sa.String(20), nullable=True))
-        print("✅ Added 'decision' column to claims table")
-    else:
-        print("⏭️  'decision' column already exists, skipping")
+    # Postgres performs the existence check server-side (no reflection round-trip)
+    op.execute("ALTER TABLE claims ADD COLUMN IF NOT EXISTS decision VARCHAR(20)")
+    logger.debug("Ensured 'decision' column on claims table")
 
 
 def downgrade() -> None:
     """Remove decision column from claims table."""
-    # Check if column exists before dropping
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [col['name'] for col in inspector.get_columns('claims')]
-    
-    if 'decision' in columns:
-        op.drop_column('claims', 'decision')
-        print("✅ Dropped 'decision' column from claims table")
-    else:
-        print("⏭️  'decision' column doesn't exist, skipping")
+    op.execute("ALTER TABLE claims DROP COLUMN IF EXISTS decision")
+    logger.debug("Ensured 'decision' column dropped from claims table")
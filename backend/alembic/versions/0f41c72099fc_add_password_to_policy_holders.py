@@ -6,10 +6,12 @@ Create Date: 2025-12-22 12:12:26.322099
 
 """
 from typing import Sequence, Union
+import logging
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+logger = logging.getLogger("alembic.runtime.migration")
 
 
 # revision identifiers, used by Alembic.
@@ -20,35 +22,21 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [col['name'] for col in inspector.get_columns('policy_holders')]
-    
     # Add hashed_password column if it doesn't exist
-    if 'hashed_password' not in columns:
-        op.add_column('policy_holders', sa.Column('hashed_password', sa.String(), nullable=True))
-        print("✅ Added 'hashed_password' column")
-    else:
-        print("⏭️  'hashed_password' column already exists, skipping")
+    op.execute("ALTER TABLE policy_holders ADD COLUMN IF NOT EXISTS hashed_password VARCHAR")
+    logger.debug("Ensured 'hashed_password' column")
     
     # Add is_active column if it doesn't exist
-    if 'is_active' not in columns:
-        op.add_column('policy_holders', sa.Column('is_active', sa.Boolean(), server_default='true', nullable=False))
-        print("✅ Added 'is_active' column")
-    else:
-        print("⏭️  'is_active' column already exists, skipping")
+    op.execute(
+        "ALTER TABLE policy_holders ADD COLUMN IF NOT EXISTS is_active BOOLEAN NOT NULL DEFAULT true"
+    )
+    logger.debug("Ensured 'is_active' column")
 
 
 def downgrade() -> None:
-    conn = op.get_bind()
-    inspector = inspect(conn)
-    columns = [col['name'] for col in inspector.get_columns('policy_holders')]
-    
     # Remove columns if they exist
-    if 'is_active' in columns:
-        op.drop_column('policy_holders', 'is_active')
-        print("✅ Dropped 'is_active' column")
+    op.execute("ALTER TABLE policy_holders DROP COLUMN IF EXISTS is_active")
+    logger.debug("Ensured 'is_active' column dropped")
     
-    if 'hashed_password' in columns:
-        op.drop_column('policy_holders', 'hashed_password')
-        print("✅ Dropped 'hashed_password' column")
+    op.execute("ALTER TABLE policy_holders DROP COLUMN IF EXISTS hashed_password")
+    logger.debug("Ensured 'hashed_password' column dropped")
@@ -0,0 +1,41 @@
+"""add usage log endpoint timestamp index
+
+Revision ID: 12ab4196f15b
+Revises: 6adf6c570412
+Create Date: 2026-01-05 10:08:52.661940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '12ab4196f15b'
+down_revision: Union[str, Sequence[str], None] = '6adf6c570412'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the endpoint index with (endpoint, timestamp DESC)."""
+    # Serves "WHERE endpoint = ? ORDER BY timestamp DESC" and still covers
+    # plain endpoint lookups, so the single-column index goes.
+    # CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_usage_logs_endpoint_ts "
+            "ON api_usage_logs (endpoint, timestamp DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_api_usage_logs_endpoint")
+
+
+def downgrade() -> None:
+    """Restore the single-column endpoint index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_usage_logs_endpoint "
+            "ON api_usage_logs (endpoint)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_api_usage_logs_endpoint_ts")
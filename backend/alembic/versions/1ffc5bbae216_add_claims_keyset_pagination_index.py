@@ -0,0 +1,35 @@
+"""add claims keyset pagination index
+
+Revision ID: 1ffc5bbae216
+Revises: dfb180d459da
+Create Date: 2026-01-07 15:41:18.904127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1ffc5bbae216'
+down_revision: Union[str, Sequence[str], None] = 'dfb180d459da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index claims on (submission_date DESC, claim_id DESC)."""
+    # Matches list_claims' newest-first ORDER BY so each page is an index
+    # range scan starting at the cursor instead of an OFFSET scan.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_claims_submission_date_claim_id "
+            "ON claims (submission_date DESC, claim_id DESC)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_claims_submission_date_claim_id")
@@ -0,0 +1,34 @@
+"""add manual reviews pending partial index
+
+Revision ID: 223760ae5112
+Revises: 4ec7cf07fc48
+Create Date: 2026-01-05 11:02:17.904126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '223760ae5112'
+down_revision: Union[str, Sequence[str], None] = '4ec7cf07fc48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index pending manual reviews by id (keyset pagination)."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_manual_reviews_pending "
+            "ON manual_reviews (id) WHERE review_status = 'PENDING'"
+        )
+
+
+def downgrade() -> None:
+    """Drop the pending manual reviews partial index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_manual_reviews_pending")
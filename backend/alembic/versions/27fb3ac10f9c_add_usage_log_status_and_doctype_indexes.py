@@ -0,0 +1,57 @@
+"""add usage log status and doctype indexes
+
+Revision ID: 27fb3ac10f9c
+Revises: 784c9d84080f
+Create Date: 2026-01-09 09:18:44.562907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27fb3ac10f9c'
+down_revision: Union[str, Sequence[str], None] = '784c9d84080f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Parent index name -> (per-partition suffix, columns)
+INDEXES = {
+    "ix_api_usage_logs_status_ts": ("status_ts_idx", "(status, timestamp)"),
+    "ix_api_usage_logs_doctype_ts": ("doctype_ts_idx", "(document_type, timestamp)"),
+}
+
+
+def upgrade() -> None:
+    """Composite (status, timestamp) and (document_type, timestamp) indexes."""
+    # CREATE INDEX CONCURRENTLY is not allowed on a partitioned table: create
+    # each index on the parent only (instant, starts out invalid), build it
+    # concurrently on every partition, then attach the partition indexes,
+    # which makes the parent index valid. Partitions created later inherit
+    # the index automatically.
+    partitions = op.get_bind().execute(sa.text(
+        "SELECT inhrelid::regclass::text FROM pg_inherits "
+        "WHERE inhparent = 'api_usage_logs'::regclass"
+    )).scalars().all()
+    
+    for name, (_, columns) in INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY api_usage_logs {columns}")
+    
+    with op.get_context().autocommit_block():
+        for name, (suffix, columns) in INDEXES.items():
+            for partition in partitions:
+                partition_index = f"{partition}_{suffix}"
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} "
+                    f"ON {partition} {columns}"
+                )
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def downgrade() -> None:
+    """Drop the usage log status and doctype indexes."""
+    # Dropping the parent index drops the attached partition indexes too
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,50 @@
+"""add api usage hourly rollup
+
+Revision ID: 43700485908c
+Revises: 27fb3ac10f9c
+Create Date: 2026-01-09 11:02:15.338471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '43700485908c'
+down_revision: Union[str, Sequence[str], None] = '27fb3ac10f9c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create api_usage_hourly and backfill it from api_usage_logs."""
+    op.create_table(
+        'api_usage_hourly',
+        sa.Column('hour', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('document_type', sa.String(), nullable=False),
+        sa.Column('requests', sa.Integer(), nullable=False),
+        sa.Column('tokens', sa.BigInteger(), nullable=False),
+        sa.Column('cost_usd', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('hour', 'document_type')
+    )
+    
+    # Same aggregation as app.services.usage_rollup; from here on the
+    # rollup_usage_hourly_task beat job keeps it current
+    op.execute("""
+        INSERT INTO api_usage_hourly (hour, document_type, requests, tokens, cost_usd)
+        SELECT date_trunc('hour', timestamp, 'UTC'),
+               COALESCE(document_type, 'unknown'),
+               COUNT(*),
+               COALESCE(SUM(total_tokens), 0),
+               COALESCE(SUM(cost_usd), 0.0)
+        FROM api_usage_logs
+        WHERE status = 'success'
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    """Drop api_usage_hourly."""
+    op.drop_table('api_usage_hourly')
@@ -0,0 +1,34 @@
+"""add pending review partial index
+
+Revision ID: 4ec7cf07fc48
+Revises: 12ab4196f15b
+Create Date: 2026-01-05 10:12:41.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4ec7cf07fc48'
+down_revision: Union[str, Sequence[str], None] = '12ab4196f15b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only unreviewed decisions (pending-review list and stats)."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_claim_decisions_pending_review "
+            "ON claim_decisions (decision) WHERE reviewed_by IS NULL"
+        )
+
+
+def downgrade() -> None:
+    """Drop the pending-review partial index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_claim_decisions_pending_review")
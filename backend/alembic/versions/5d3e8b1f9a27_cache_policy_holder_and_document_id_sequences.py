@@ -0,0 +1,37 @@
+"""cache policy holder and document id sequences
+
+Revision ID: 5d3e8b1f9a27
+Revises: b26ea4f42520
+Create Date: 2026-01-12 11:20:43.518206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3e8b1f9a27'
+down_revision: Union[str, Sequence[str], None] = 'b26ea4f42520'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cache 50 values per backend for policy_holder_id_seq and document_id_seq."""
+    # claim_id_seq keeps CACHE 1 so claim IDs stay gap-free and ordered for
+    # auditing; PH/DOC numbering may have gaps after a crash or disconnect,
+    # in exchange for one sequence WAL write and lock per 50 nextval() calls
+    op.execute(sa.text("""
+        ALTER SEQUENCE policy_holder_id_seq CACHE 50;
+        ALTER SEQUENCE document_id_seq CACHE 50;
+    """))
+
+
+def downgrade() -> None:
+    """Restore CACHE 1 on both sequences."""
+    op.execute(sa.text("""
+        ALTER SEQUENCE policy_holder_id_seq CACHE 1;
+        ALTER SEQUENCE document_id_seq CACHE 1;
+    """))
@@ -0,0 +1,34 @@
+"""drop redundant usage log id index
+
+Revision ID: 6adf6c570412
+Revises: bcbe87edf19f
+Create Date: 2026-01-05 10:05:17.204318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6adf6c570412'
+down_revision: Union[str, Sequence[str], None] = 'bcbe87edf19f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop ix_api_usage_logs_id; the primary key already indexes id."""
+    # CONCURRENTLY cannot run inside a transaction; keeps the table writable
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_api_usage_logs_id")
+
+
+def downgrade() -> None:
+    """Recreate the standalone id index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_usage_logs_id "
+            "ON api_usage_logs (id)"
+        )
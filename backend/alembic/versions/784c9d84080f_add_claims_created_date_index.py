@@ -0,0 +1,35 @@
+"""add claims created date index
+
+Revision ID: 784c9d84080f
+Revises: c64c78ff2f97
+Create Date: 2026-01-08 14:27:51.903114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '784c9d84080f'
+down_revision: Union[str, Sequence[str], None] = 'c64c78ff2f97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Expression index on date(claims.created_at)."""
+    # /metrics/trends filters and groups on date(created_at); created_at is
+    # timestamp without time zone, so date() is immutable and indexable.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_claims_created_date "
+            "ON claims (date(created_at))"
+        )
+
+
+def downgrade() -> None:
+    """Drop the claims created date index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_claims_created_date")
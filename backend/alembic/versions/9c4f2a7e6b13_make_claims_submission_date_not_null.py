@@ -0,0 +1,45 @@
+"""make claims submission date not null
+
+Revision ID: 9c4f2a7e6b13
+Revises: 5d3e8b1f9a27
+Create Date: 2026-01-12 14:02:18.660931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f2a7e6b13'
+down_revision: Union[str, Sequence[str], None] = '5d3e8b1f9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Backfill submission_date from created_at, then make it NOT NULL."""
+    # submission_date was only a Python-side default, so seeded or raw-SQL
+    # rows can be NULL; keyset pagination in list_claims needs it on every row
+    op.execute("""
+        UPDATE claims
+        SET submission_date = COALESCE(created_at, timezone('utc', now()))
+        WHERE submission_date IS NULL
+    """)
+    op.alter_column(
+        'claims', 'submission_date',
+        existing_type=sa.DateTime(),
+        nullable=False,
+        server_default=sa.text("timezone('utc', now())")
+    )
+
+
+def downgrade() -> None:
+    """Make submission_date nullable again (backfilled values are kept)."""
+    op.alter_column(
+        'claims', 'submission_date',
+        existing_type=sa.DateTime(),
+        nullable=True,
+        server_default=None
+    )
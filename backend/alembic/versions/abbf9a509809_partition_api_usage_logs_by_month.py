@@ -0,0 +1,170 @@
+"""partition api_usage_logs by month
+
+Revision ID: abbf9a509809
+Revises: 223760ae5112
+Create Date: 2026-01-06 09:41:52.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'abbf9a509809'
+down_revision: Union[str, Sequence[str], None] = '223760ae5112'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows copied per INSERT ... SELECT when moving existing data
+BATCH_SIZE = 1000
+
+# Months to pre-create past the current one
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, timestamp, endpoint, document_id, document_type, model, tokens_input, "
+    "tokens_output, total_tokens, cost_usd, status, error_message, response_time_ms"
+)
+
+
+def _copy_in_batches(source: str, target: str, select_columns: str = COLUMNS) -> None:
+    """Copy rows between tables in id order, BATCH_SIZE rows per statement."""
+    bind = op.get_bind()
+    copy_batch = sa.text(f"""
+        WITH batch AS (
+            SELECT * FROM {source}
+            WHERE id > :last_id
+            ORDER BY id
+            LIMIT :batch_size
+        ), copied AS (
+            INSERT INTO {target} ({COLUMNS})
+            SELECT {select_columns} FROM batch
+        )
+        SELECT MAX(id) FROM batch
+    """)
+    last_id = 0
+    while True:
+        last_id = bind.execute(
+            copy_batch, {"last_id": last_id, "batch_size": BATCH_SIZE}
+        ).scalar()
+        if last_id is None:
+            break
+
+
+def upgrade() -> None:
+    """Convert api_usage_logs to a monthly range-partitioned table."""
+    # Move the existing table out of the way, keeping its id sequence
+    op.execute("""
+        ALTER TABLE api_usage_logs RENAME TO api_usage_logs_old;
+        ALTER TABLE api_usage_logs_old RENAME CONSTRAINT api_usage_logs_pkey TO api_usage_logs_old_pkey;
+        DROP INDEX IF EXISTS ix_api_usage_logs_timestamp;
+        DROP INDEX IF EXISTS ix_api_usage_logs_endpoint_ts;
+        DROP INDEX IF EXISTS ix_api_usage_logs_document_id;
+        ALTER SEQUENCE api_usage_logs_id_seq OWNED BY NONE;
+    """)
+    
+    # The partition key must be part of the primary key, hence (id, timestamp)
+    op.execute("""
+        CREATE TABLE api_usage_logs (
+            id INTEGER NOT NULL DEFAULT nextval('api_usage_logs_id_seq'),
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            endpoint VARCHAR,
+            document_id VARCHAR,
+            document_type VARCHAR,
+            model VARCHAR,
+            tokens_input INTEGER,
+            tokens_output INTEGER,
+            total_tokens INTEGER,
+            cost_usd DOUBLE PRECISION,
+            status VARCHAR,
+            error_message VARCHAR,
+            response_time_ms INTEGER,
+            CONSTRAINT api_usage_logs_pkey PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp);
+        ALTER SEQUENCE api_usage_logs_id_seq OWNED BY api_usage_logs.id;
+    """)
+    
+    # One partition per month from the oldest existing row through
+    # MONTHS_AHEAD months from now; anything outside lands in the default
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start DATE;
+            last_month DATE := date_trunc('month', now()) + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            SELECT date_trunc('month', COALESCE(MIN(timestamp), now()))
+            INTO month_start
+            FROM api_usage_logs_old;
+            
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF api_usage_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'api_usage_logs_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$;
+        CREATE TABLE IF NOT EXISTS api_usage_logs_default PARTITION OF api_usage_logs DEFAULT;
+    """)
+    
+    # Indexes declared on the parent are created on every partition
+    op.execute("""
+        CREATE INDEX ix_api_usage_logs_timestamp ON api_usage_logs (timestamp);
+        CREATE INDEX ix_api_usage_logs_endpoint_ts ON api_usage_logs (endpoint, timestamp DESC);
+        CREATE INDEX ix_api_usage_logs_document_id ON api_usage_logs (document_id);
+    """)
+    
+    # Old rows may have a NULL timestamp, which the partition key forbids
+    _copy_in_batches(
+        "api_usage_logs_old",
+        "api_usage_logs",
+        COLUMNS.replace("timestamp", "COALESCE(timestamp, now())", 1)
+    )
+    op.execute("DROP TABLE api_usage_logs_old")
+
+
+def downgrade() -> None:
+    """Convert api_usage_logs back to a single unpartitioned table."""
+    op.execute("""
+        ALTER TABLE api_usage_logs RENAME TO api_usage_logs_partitioned;
+        ALTER TABLE api_usage_logs_partitioned RENAME CONSTRAINT api_usage_logs_pkey TO api_usage_logs_partitioned_pkey;
+        DROP INDEX IF EXISTS ix_api_usage_logs_timestamp;
+        DROP INDEX IF EXISTS ix_api_usage_logs_endpoint_ts;
+        DROP INDEX IF EXISTS ix_api_usage_logs_document_id;
+        ALTER SEQUENCE api_usage_logs_id_seq OWNED BY NONE;
+    """)
+    
+    op.execute("""
+        CREATE TABLE api_usage_logs (
+            id INTEGER NOT NULL DEFAULT nextval('api_usage_logs_id_seq'),
+            timestamp TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            endpoint VARCHAR,
+            document_id VARCHAR,
+            document_type VARCHAR,
+            model VARCHAR,
+            tokens_input INTEGER,
+            tokens_output INTEGER,
+            total_tokens INTEGER,
+            cost_usd DOUBLE PRECISION,
+            status VARCHAR,
+            error_message VARCHAR,
+            response_time_ms INTEGER,
+            CONSTRAINT api_usage_logs_pkey PRIMARY KEY (id)
+        );
+        ALTER SEQUENCE api_usage_logs_id_seq OWNED BY api_usage_logs.id;
+    """)
+    
+    _copy_in_batches("api_usage_logs_partitioned", "api_usage_logs")
+    
+    # Dropping the parent drops all of its partitions
+    op.execute("""
+        DROP TABLE api_usage_logs_partitioned;
+        CREATE INDEX ix_api_usage_logs_timestamp ON api_usage_logs (timestamp);
+        CREATE INDEX ix_api_usage_logs_endpoint_ts ON api_usage_logs (endpoint, timestamp DESC);
+        CREATE INDEX ix_api_usage_logs_document_id ON api_usage_logs (document_id);
+    """)
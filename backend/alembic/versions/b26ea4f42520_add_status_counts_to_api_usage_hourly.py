@@ -0,0 +1,52 @@
+"""add status counts to api usage hourly
+
+Revision ID: b26ea4f42520
+Revises: e4891971a405
+Create Date: 2026-01-10 09:55:31.207648
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b26ea4f42520'
+down_revision: Union[str, Sequence[str], None] = 'e4891971a405'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add rate_limited/failed counts to api_usage_hourly and recompute it."""
+    op.add_column('api_usage_hourly', sa.Column('rate_limited', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('api_usage_hourly', sa.Column('failed', sa.Integer(), nullable=False, server_default='0'))
+    
+    # Rows now exist for any outcome, not just hours with a success; same
+    # aggregation as app.services.usage_rollup
+    op.execute("""
+        INSERT INTO api_usage_hourly (hour, document_type, requests, tokens, cost_usd, rate_limited, failed)
+        SELECT date_trunc('hour', timestamp, 'UTC'),
+               COALESCE(document_type, 'unknown'),
+               COUNT(*) FILTER (WHERE status = 'success'),
+               COALESCE(SUM(total_tokens) FILTER (WHERE status = 'success'), 0),
+               COALESCE(SUM(cost_usd) FILTER (WHERE status = 'success'), 0.0),
+               COUNT(*) FILTER (WHERE status = 'rate_limited'),
+               COUNT(*) FILTER (WHERE status IN ('failed', 'error'))
+        FROM api_usage_logs
+        GROUP BY 1, 2
+        ON CONFLICT (hour, document_type) DO UPDATE SET
+            requests = EXCLUDED.requests,
+            tokens = EXCLUDED.tokens,
+            cost_usd = EXCLUDED.cost_usd,
+            rate_limited = EXCLUDED.rate_limited,
+            failed = EXCLUDED.failed
+    """)
+
+
+def downgrade() -> None:
+    """Drop the status counts (rows without successes are removed)."""
+    op.execute("DELETE FROM api_usage_hourly WHERE requests = 0")
+    op.drop_column('api_usage_hourly', 'failed')
+    op.drop_column('api_usage_hourly', 'rate_limited')
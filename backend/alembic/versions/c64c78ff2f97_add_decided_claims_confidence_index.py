@@ -0,0 +1,35 @@
+"""add decided claims confidence index
+
+Revision ID: c64c78ff2f97
+Revises: 1ffc5bbae216
+Create Date: 2026-01-08 10:12:37.418290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64c78ff2f97'
+down_revision: Union[str, Sequence[str], None] = '1ffc5bbae216'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Partial index on claims.confidence_score for decided claims."""
+    # Lets /metrics/accuracy count its confidence buckets from the index
+    # alone instead of scanning every claim row.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_claims_decided_confidence "
+            "ON claims (confidence_score) WHERE decision IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    """Drop the decided claims confidence index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_claims_decided_confidence")
@@ -0,0 +1,46 @@
+"""add dependent id sequence
+
+Revision ID: dfb180d459da
+Revises: f7ac483d0c1d
+Create Date: 2026-01-07 15:03:44.270519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dfb180d459da'
+down_revision: Union[str, Sequence[str], None] = 'f7ac483d0c1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create dependent_id_seq (DEP000001, DEP000002, ...) seeded past existing IDs."""
+    # CACHE 50 like policy_holder_id_seq / document_id_seq: dependent IDs
+    # may have gaps after a crash, in exchange for less sequence contention
+    op.execute(sa.text("""
+        CREATE SEQUENCE IF NOT EXISTS dependent_id_seq
+        START WITH 1
+        INCREMENT BY 1
+        NO MINVALUE
+        NO MAXVALUE
+        CACHE 50;
+
+        SELECT setval('dependent_id_seq',
+            COALESCE(
+                (SELECT MAX(CAST(SUBSTRING(dependent_id FROM 4) AS INTEGER))
+                 FROM dependents
+                 WHERE dependent_id ~ '^DEP[0-9]+$'),
+                1
+            )
+        );
+    """))
+
+
+def downgrade() -> None:
+    """Drop dependent_id_seq."""
+    op.execute("DROP SEQUENCE IF EXISTS dependent_id_seq")
@@ -0,0 +1,54 @@
+"""add usage log covering timestamp index
+
+Revision ID: e4891971a405
+Revises: 43700485908c
+Create Date: 2026-01-09 14:40:06.721953
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4891971a405'
+down_revision: Union[str, Sequence[str], None] = '43700485908c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_api_usage_logs_ts_covering"
+DEFINITION = (
+    "(timestamp DESC) INCLUDE (document_id, document_type, model, "
+    "total_tokens, cost_usd, status, response_time_ms)"
+)
+
+
+def upgrade() -> None:
+    """Covering timestamp index, replacing the plain ix_api_usage_logs_timestamp."""
+    # Partitioned table: parent-only index, concurrent build per partition,
+    # then attach (see 27fb3ac10f9c)
+    partitions = op.get_bind().execute(sa.text(
+        "SELECT inhrelid::regclass::text FROM pg_inherits "
+        "WHERE inhparent = 'api_usage_logs'::regclass"
+    )).scalars().all()
+    
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX} ON ONLY api_usage_logs {DEFINITION}")
+    
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            partition_index = f"{partition}_ts_covering_idx"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} "
+                f"ON {partition} {DEFINITION}"
+            )
+            op.execute(f"ALTER INDEX {INDEX} ATTACH PARTITION {partition_index}")
+    
+    # Leading timestamp column makes the plain index redundant
+    op.execute("DROP INDEX IF EXISTS ix_api_usage_logs_timestamp")
+
+
+def downgrade() -> None:
+    """Restore the plain timestamp index and drop the covering one."""
+    op.execute("CREATE INDEX IF NOT EXISTS ix_api_usage_logs_timestamp ON api_usage_logs (timestamp)")
+    op.execute(f"DROP INDEX IF EXISTS {INDEX}")
@@ -0,0 +1,41 @@
+"""index document and dependent foreign keys
+
+Revision ID: f7ac483d0c1d
+Revises: abbf9a509809
+Create Date: 2026-01-07 14:20:06.512883
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7ac483d0c1d'
+down_revision: Union[str, Sequence[str], None] = 'abbf9a509809'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index documents.claim_id and dependents.policy_holder_id."""
+    # claims.claim_id, claims.policy_holder_id and policy_holders.email are
+    # already indexed; these two foreign keys back list_documents and
+    # list_dependents. CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_claim_id "
+            "ON documents (claim_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dependents_policy_holder_id "
+            "ON dependents (policy_holder_id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the foreign key indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_dependents_policy_holder_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_claim_id")
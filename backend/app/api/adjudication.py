@@ -3,15 +3,18 @@ Claims Adjudication API
 Endpoints for automated claim decision-making
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from typing import List
 import logging
-from datetime import datetime
 
-from app.models.models import ClaimDecision, Claim, PolicyHolder, Document, DecisionType
+from app.models.models import ClaimDecision, Claim, DecisionType
 from app.schemas.schemas import ClaimDecisionResponse, AdjudicationRequest, ManualReviewOverride
-from app.services.adjudication_engine import AdjudicationEngine
-from app.utils.database import get_db
+from app.services.adjudication_engine import get_adjudication_engine
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +24,7 @@ router = APIRouter(prefix="/api/adjudication", tags=["Adjudication"])
 @router.post("/claims/{claim_id}/adjudicate", response_model=ClaimDecisionResponse)
 async def adjudicate_claim(
     claim_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Trigger automated adjudication for a claim
@@ -36,35 +39,46 @@ async def adjudicate_claim(
     try:
         logger.info(f"📋 Adjudication requested for claim {claim_id}")
         
-        # Get claim
-        claim = db.query(Claim).filter(Claim.claim_id == claim_id).first()
-        if not claim:
+        # Get claim with policy holder, documents and whether a decision
+        # already exists in one round-trip (documents via a single
+        # SELECT ... IN). Only presence of the decision is needed, so it is
+        # an EXISTS column rather than a full row.
+        decision_exists = exists().where(ClaimDecision.claim_id == Claim.claim_id)
+        row = (await db.execute(
+            select(Claim, decision_exists.label("has_decision"))
+            .options(joinedload(Claim.policy_holder), selectinload(Claim.documents))
+            .where(Claim.claim_id == claim_id)
+        )).first()
+        if not row:
             raise HTTPException(status_code=404, detail=f"Claim {claim_id} not found")
+        claim, has_decision = row
         
-        # Get policy holder
-        policy_holder = db.query(PolicyHolder).filter(
-            PolicyHolder.policy_holder_id == claim.policy_holder_id
-        ).first()
+        policy_holder = claim.policy_holder
         if not policy_holder:
             raise HTTPException(status_code=404, detail="Policy holder not found")
         
         # Get extracted data from documents
-        documents = db.query(Document).filter(Document.claim_id == claim_id).all()
+        documents = claim.documents
         if not documents:
             raise HTTPException(status_code=400, detail="No documents found for claim")
         
-        # Combine extracted data from all documents
-        extracted_data = {}
-        for doc in documents:
-            if doc.extracted_data:
-                extracted_data.update(doc.extracted_data)
+        # Combine extracted data from all documents in a single pass
+        # (later documents win on key collisions)
+        merged = {
+            key: value
+            for doc in documents if doc.extracted_data
+            for key, value in doc.extracted_data.items()
+        }
         
-        if not extracted_data:
+        if not merged:
             raise HTTPException(status_code=400, detail="No extracted data available. Please process documents first.")
         
         # Add claim amount
-        extracted_data["total_amount"] = claim.claimed_amount
-        extracted_data["treatment_type"] = claim.treatment_type or "consultation"
+        extracted_data = {
+            **merged,
+            "total_amount": claim.claimed_amount,
+            "treatment_type": claim.treatment_type or "consultation"
+        }
         
         # Prepare policy holder data
         policy_holder_data = {
@@ -77,28 +91,35 @@ async def adjudicate_claim(
         }
         
         # Run adjudication
-        engine = AdjudicationEngine()
+        engine = get_adjudication_engine()
         decision = await engine.adjudicate_claim(claim_id, extracted_data, policy_holder_data)
         
-        # Check if decision already exists
-        existing_decision = db.query(ClaimDecision).filter(
-            ClaimDecision.claim_id == claim_id
-        ).first()
-        
-        if existing_decision:
-            # Update existing decision
-            for key, value in decision.__dict__.items():
-                if not key.startswith('_'):
-                    setattr(existing_decision, key, value)
-            db.commit()
-            db.refresh(existing_decision)
-            logger.info(f"✅ Updated decision for claim {claim_id}: {existing_decision.decision}")
-            return existing_decision
+        if has_decision:
+            # Update existing decision with one UPDATE (no per-attribute
+            # change tracking, no refresh). Columns the engine left unset
+            # fall back to their scalar defaults, as on insert.
+            update_values = {}
+            for column in ClaimDecision.__table__.columns:
+                if column.key == "id":
+                    continue
+                if column.key in decision.__dict__:
+                    update_values[column.key] = decision.__dict__[column.key]
+                elif column.default is not None and column.default.is_scalar:
+                    update_values[column.key] = column.default.arg
+            
+            await db.execute(
+                update(ClaimDecision)
+                .where(ClaimDecision.claim_id == claim_id)
+                .values(**update_values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            logger.info(f"✅ Updated decision for claim {claim_id}: {decision.decision}")
+            return ClaimDecisionResponse(**update_values)
         else:
             # Save new decision
             db.add(decision)
-            db.commit()
-            db.refresh(decision)
+            await db.commit()
             
             # Update claim status
             claim.status = decision.decision.value.lower()
@@ -108,7 +129,7 @@ async def adjudicate_claim(
             claim.rejection_reasons = decision.rejection_reasons
             claim.notes = decision.notes
             claim.next_steps = decision.next_steps
-            db.commit()
+            await db.commit()
             
             logger.info(f"✅ Adjudication complete for claim {claim_id}: {decision.decision}")
             return decision
@@ -123,7 +144,7 @@ async def adjudicate_claim(
 @router.get("/claims/{claim_id}/decision", response_model=ClaimDecisionResponse)
 async def get_decision(
     claim_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get adjudication decision for a claim
@@ -131,7 +152,9 @@ async def get_decision(
     Returns:
         Full decision with reasoning, validation results, and next steps
     """
-    decision = db.query(ClaimDecision).filter(ClaimDecision.claim_id == claim_id).first()
+    decision = (await db.execute(
+        select(ClaimDecision).where(ClaimDecision.claim_id == claim_id)
+    )).scalar_one_or_none()
     
     if not decision:
         raise HTTPException(
@@ -144,7 +167,7 @@ async def get_decision(
 
 @router.get("/claims/pending-review", response_model=List[ClaimDecisionResponse])
 async def get_pending_reviews(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     limit: int = 50
 ):
     """
@@ -153,10 +176,12 @@ async def get_pending_reviews(
     Returns:
         List of claims with MANUAL_REVIEW decision
     """
-    decisions = db.query(ClaimDecision).filter(
-        ClaimDecision.decision == DecisionType.MANUAL_REVIEW,
-        ClaimDecision.reviewed_by == None
-    ).limit(limit).all()
+    decisions = (await db.execute(
+        select(ClaimDecision).where(
+            ClaimDecision.decision == DecisionType.MANUAL_REVIEW,
+            ClaimDecision.reviewed_by.is_(None)
+        ).limit(limit)
+    )).scalars().all()
     
     logger.info(f"📋 Found {len(decisions)} claims pending manual review")
     return decisions
@@ -166,7 +191,7 @@ async def get_pending_reviews(
 async def override_decision(
     claim_id: str,
     override: ManualReviewOverride,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Human reviewer overrides automated decision
@@ -177,37 +202,52 @@ async def override_decision(
         - review_notes: Explanation for override
         - reason: Reason for manual intervention
     """
-    decision = db.query(ClaimDecision).filter(ClaimDecision.claim_id == claim_id).first()
+    # Update decision with manual override
+    decision_values = {
+        "decision": override.new_decision,
+        "reviewed_by": override.reviewer_id,
+        "reviewed_at": utc_now(),
+        "review_notes": override.review_notes
+    }
+    if override.approved_amount is not None:
+        decision_values["approved_amount"] = override.approved_amount
     
-    if not decision:
-        raise HTTPException(status_code=404, detail=f"No decision found for claim {claim_id}")
+    updated_decision = (
+        update(ClaimDecision)
+        .where(ClaimDecision.claim_id == claim_id)
+        .values(**decision_values)
+        .returning(*ClaimDecision.__table__.columns)
+        .cte("updated_decision")
+    )
     
-    # Update decision with manual override
-    decision.decision = override.new_decision
-    decision.reviewed_by = override.reviewer_id
-    decision.reviewed_at = datetime.utcnow()
-    decision.review_notes = override.review_notes
+    # Update claim from the same statement (one round-trip, atomic)
+    updated_claim = (
+        update(Claim)
+        .where(Claim.claim_id == claim_id)
+        .values(
+            status=override.new_decision.value.lower(),
+            decision=override.new_decision,
+            approved_amount=select(updated_decision.c.approved_amount).scalar_subquery(),
+            notes=f"Manual override by {override.reviewer_id}: {override.review_notes}"
+        )
+        .cte("updated_claim")
+    )
     
-    if override.approved_amount is not None:
-        decision.approved_amount = override.approved_amount
+    row = (await db.execute(select(updated_decision).add_cte(updated_claim))).first()
     
-    # Update claim
-    claim = db.query(Claim).filter(Claim.claim_id == claim_id).first()
-    if claim:
-        claim.status = override.new_decision.value.lower()
-        claim.decision = override.new_decision
-        claim.approved_amount = decision.approved_amount
-        claim.notes = f"Manual override by {override.reviewer_id}: {override.review_notes}"
+    if not row:
+        # Nothing to override; discard the claim update as well
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=f"No decision found for claim {claim_id}")
     
-    db.commit()
-    db.refresh(decision)
+    await db.commit()
     
     logger.info(f"✅ Decision overridden for claim {claim_id} by {override.reviewer_id}")
-    return decision
+    return ClaimDecisionResponse(**row._mapping)
 
 
-@router.get("/stats/decisions")
-async def get_decision_stats(db: Session = Depends(get_db)):
+@router.get("/stats/decisions", response_class=ORJSONResponse)
+async def get_decision_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Get adjudication statistics
     
@@ -219,31 +259,39 @@ async def get_decision_stats(db: Session = Depends(get_db)):
     """
     from sqlalchemy import func
     
-    total = db.query(func.count(ClaimDecision.id)).scalar()
-    
-    approved = db.query(func.count(ClaimDecision.id)).filter(
-        ClaimDecision.decision == DecisionType.APPROVED
-    ).scalar()
+    # One pass over claim_decisions; totals are folded together in Python
+    # from the handful of (decision, unreviewed) groups
+    unreviewed = ClaimDecision.reviewed_by.is_(None).label("unreviewed")
+    rows = (await db.execute(
+        select(
+            ClaimDecision.decision,
+            unreviewed,
+            func.count(ClaimDecision.id).label("n"),
+            func.sum(ClaimDecision.confidence_score).label("confidence_sum"),
+            func.count(ClaimDecision.confidence_score).label("confidence_n")
+        ).group_by(ClaimDecision.decision, unreviewed)
+    )).all()
     
-    rejected = db.query(func.count(ClaimDecision.id)).filter(
-        ClaimDecision.decision == DecisionType.REJECTED
-    ).scalar()
+    counts = {}
+    pending_review = 0
+    confidence_sum = 0.0
+    confidence_n = 0
+    for row in rows:
+        counts[row.decision] = counts.get(row.decision, 0) + row.n
+        if row.decision == DecisionType.MANUAL_REVIEW and row.unreviewed:
+            pending_review += row.n
+        confidence_sum += row.confidence_sum or 0.0
+        confidence_n += row.confidence_n
     
-    manual_review = db.query(func.count(ClaimDecision.id)).filter(
-        ClaimDecision.decision == DecisionType.MANUAL_REVIEW
-    ).scalar()
-    
-    avg_confidence = db.query(func.avg(ClaimDecision.confidence_score)).scalar()
+    total = sum(counts.values())
+    approved = counts.get(DecisionType.APPROVED, 0)
     
     return {
-        "total_decisions": total or 0,
-        "approved": approved or 0,
-        "rejected": rejected or 0,
-        "manual_review": manual_review or 0,
-        "pending_review": db.query(func.count(ClaimDecision.id)).filter(
-            ClaimDecision.decision == DecisionType.MANUAL_REVIEW,
-            ClaimDecision.reviewed_by == None
-        ).scalar() or 0,
-        "average_confidence": float(avg_confidence) if avg_confidence else 0.0,
+        "total_decisions": total,
+        "approved": approved,
+        "rejected": counts.get(DecisionType.REJECTED, 0),
+        "manual_review": counts.get(DecisionType.MANUAL_REVIEW, 0),
+        "pending_review": pending_review,
+        "average_confidence": confidence_sum / confidence_n if confidence_n else 0.0,
         "approval_rate": (approved / total * 100) if total > 0 else 0.0
     }
@@ -1,25 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
 from app.schemas import ManualReviewCreate, ManualReviewUpdate
-from app.models import ManualReview, Claim
-from app.utils.database import get_db
+from app.models import ManualReview, Claim, DecisionType
+from app.utils.database import get_async_db
 
 router = APIRouter()
 
 @router.get("/reviews/pending")
-async def get_pending_reviews(db: Session = Depends(get_db)):
-    """Get all claims pending manual review"""
-    reviews = db.query(ManualReview).filter(
-        ManualReview.review_status == "PENDING"
-    ).all()
+async def get_pending_reviews(
+    db: AsyncSession = Depends(get_async_db),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = None
+):
+    """
+    Get claims pending manual review, oldest first
+    
+    Keyset-paginated: pass the id of the last review on the previous page
+    as `cursor` to fetch the next page.
+    """
+    stmt = select(ManualReview).where(ManualReview.review_status == "PENDING")
+    if cursor is not None:
+        stmt = stmt.where(ManualReview.id > cursor)
+    reviews = (await db.execute(stmt.order_by(ManualReview.id).limit(limit))).scalars().all()
     return reviews
 
 @router.post("/reviews", status_code=201)
-async def create_manual_review(review: ManualReviewCreate, db: Session = Depends(get_db)):
+async def create_manual_review(review: ManualReviewCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a manual review request"""
-    claim = db.query(Claim).filter(Claim.claim_id == review.claim_id).first()
+    claim = (await db.execute(
+        select(Claim).where(Claim.claim_id == review.claim_id)
+    )).scalar_one_or_none()
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
     
@@ -29,8 +43,7 @@ async def create_manual_review(review: ManualReviewCreate, db: Session = Depends
         review_notes=review.review_notes
     )
     db.add(db_review)
-    db.commit()
-    db.refresh(db_review)
+    await db.commit()
     
     return db_review
 
@@ -38,10 +51,12 @@ async def create_manual_review(review: ManualReviewCreate, db: Session = Depends
 async def update_review(
     review_id: int,
     review_update: ManualReviewUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a manual review"""
-    review = db.query(ManualReview).filter(ManualReview.id == review_id).first()
+    review = (await db.execute(
+        select(ManualReview).where(ManualReview.id == review_id)
+    )).scalar_one_or_none()
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     
@@ -50,34 +65,41 @@ async def update_review(
     review.review_notes = review_update.review_notes
     review.final_decision = review_update.final_decision
     
-    db.commit()
-    db.refresh(review)
+    await db.commit()
     
     return review
 
-@router.get("/analytics")
-async def get_analytics(db: Session = Depends(get_db)):
+@router.get("/analytics", response_class=ORJSONResponse)
+async def get_analytics(db: AsyncSession = Depends(get_async_db)):
     """Get system analytics"""
     from sqlalchemy import func
     
-    total_claims = db.query(func.count(Claim.id)).scalar()
-    approved_claims = db.query(func.count(Claim.id)).filter(
-        Claim.decision == "APPROVED"
-    ).scalar()
-    rejected_claims = db.query(func.count(Claim.id)).filter(
-        Claim.decision == "REJECTED"
-    ).scalar()
-    pending_reviews = db.query(func.count(ManualReview.id)).filter(
-        ManualReview.review_status == "PENDING"
-    ).scalar()
+    # Single GROUP BY pass over claims instead of one COUNT per decision
+    rows = (await db.execute(
+        select(
+            Claim.decision,
+            func.count(Claim.id).label("n"),
+            func.sum(Claim.confidence_score).label("confidence_sum"),
+            func.count(Claim.confidence_score).label("confidence_n")
+        ).group_by(Claim.decision)
+    )).all()
+    
+    counts = {row.decision: row.n for row in rows}
+    confidence_sum = sum(row.confidence_sum or 0.0 for row in rows)
+    confidence_n = sum(row.confidence_n for row in rows)
     
-    avg_confidence = db.query(func.avg(Claim.confidence_score)).scalar()
+    total_claims = sum(counts.values())
+    approved_claims = counts.get(DecisionType.APPROVED, 0)
+    rejected_claims = counts.get(DecisionType.REJECTED, 0)
+    pending_reviews = (await db.execute(
+        select(func.count(ManualReview.id)).where(ManualReview.review_status == "PENDING")
+    )).scalar()
     
     return {
         "total_claims": total_claims,
         "approved_claims": approved_claims,
         "rejected_claims": rejected_claims,
         "pending_reviews": pending_reviews,
-        "average_confidence": float(avg_confidence) if avg_confidence else 0.0,
+        "average_confidence": confidence_sum / confidence_n if confidence_n else 0.0,
         "approval_rate": (approved_claims / total_claims * 100) if total_claims > 0 else 0.0
     }
@@ -3,17 +3,20 @@ Authentication API endpoints using PolicyHolder model
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
+import asyncio
 import logging
 
-from app.utils.database import get_db
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 from app.schemas.schemas import PolicyHolderResponse
 from app.services.auth_service import (
     authenticate_user,
     create_access_token,
     get_user_by_email,
-    verify_token,
+    verify_token_cached,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 from app.models.models import PolicyHolder
@@ -43,7 +46,7 @@ class TokenResponse(BaseModel):
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> PolicyHolder:
     """Get current authenticated policy holder from token"""
     credentials_exception = HTTPException(
@@ -52,11 +55,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    token_data = verify_token(token)
+    token_data = verify_token_cached(token)
     if token_data is None or token_data.email is None:
         raise credentials_exception
     
-    user = get_user_by_email(db, email=token_data.email)
+    user = await get_user_by_email(db, email=token_data.email)
     if user is None:
         raise credentials_exception
     
@@ -71,28 +74,22 @@ async def get_current_active_user(
     return current_user
 
 @router.post("/register", response_model=TokenResponse)
-async def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
+async def register(user_data: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
     """Register new policy holder"""
-    # Check if email already exists
-    existing_user = get_user_by_email(db, email=user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
     # Import here to avoid circular dependency
     from app.models import PolicyHolder, PolicyStatus
     from app.services.auth_service import get_password_hash
-    from datetime import datetime, timedelta
     from app.utils.id_generator import generate_policy_holder_id
     
+    # Hash off the event loop; Argon2 is deliberately expensive
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
+    
     # Generate policy holder ID using atomic PostgreSQL sequence
     # This is O(1), thread-safe, and prevents race conditions
-    generated_id = generate_policy_holder_id(db)
+    generated_id = await db.run_sync(generate_policy_holder_id)
     
     # Set registration datetime (current time)
-    registration_datetime = datetime.utcnow()
+    registration_datetime = utc_now()
     
     # Policy terms ID from policy_terms.json
     policy_terms_id = "PLUM_OPD_2024"
@@ -120,15 +117,23 @@ async def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
         annual_limit=50000.0,                         # From policy_terms.json
         annual_limit_used=0.0,                        # No usage yet
         pre_existing_conditions=[],                   # Empty for new users
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         is_active=True,
         created_at=registration_datetime,
         updated_at=registration_datetime
     )
     
     db.add(policy_holder)
-    db.commit()
-    db.refresh(policy_holder)
+    # Email uniqueness is enforced by ix_policy_holders_email (no
+    # check-then-insert race, no extra lookup)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     logger.info(f"✅ Created policy holder: {policy_holder.policy_holder_id} for {policy_holder.email}")
     logger.info(f"   Policy Terms: {policy_terms_id}")
@@ -146,11 +151,10 @@ async def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
 @router.post("/login", response_model=TokenResponse)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Login with email and password"""
-    user = authenticate_user(db, form_data.username, form_data.password)
-    if not user:
+    if not await authenticate_user(db, form_data.username, form_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -160,16 +164,15 @@ async def login(
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": form_data.username}, expires_delta=access_token_expires
     )
     
     return TokenResponse(access_token=access_token)
 
 @router.post("/login/json", response_model=TokenResponse)
-async def login_json(user_data: LoginRequest, db: Session = Depends(get_db)):
+async def login_json(user_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """Login with JSON body (for frontend)"""
-    user = authenticate_user(db, user_data.email, user_data.password)
-    if not user:
+    if not await authenticate_user(db, user_data.email, user_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -178,7 +181,7 @@ async def login_json(user_data: LoginRequest, db: Session = Depends(get_db)):
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user_data.email}, expires_delta=access_token_expires
     )
     
     return TokenResponse(access_token=access_token)
@@ -186,7 +189,7 @@ async def login_json(user_data: LoginRequest, db: Session = Depends(get_db)):
 @router.get("/me", response_model=PolicyHolderResponse)
 async def get_me(current_user: PolicyHolder = Depends(get_current_active_user)):
     """Get current policy holder info"""
-    return PolicyHolderResponse.from_orm(current_user)
+    return PolicyHolderResponse.model_validate(current_user)
 
 @router.post("/logout")
 async def logout(current_user: PolicyHolder = Depends(get_current_active_user)):
@@ -1,40 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import List, Optional
 from datetime import datetime
-import uuid
 
-from app.schemas import ClaimCreate, ClaimResponse, AdjudicationResult
-from app.models import Claim, DecisionType
-from app.utils.database import get_db
+from app.schemas import ClaimCreate, ClaimResponse, ClaimListItem, AdjudicationResult
+from app.models import Claim, DecisionType, PolicyHolder
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 # DecisionEngine removed - using unified AdjudicationEngine instead
 
 # SSE imports
 from sse_starlette.sse import EventSourceResponse
 from fastapi import Request
-import asyncio
-import redis
+import redis.asyncio as aioredis
 import os
 import json
 import logging
 
 logger = logging.getLogger(__name__)
-import redis
-import os
-import json
 
 router = APIRouter()
 
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# One pool for the process: publishers and SSE subscribers borrow warm
+# connections instead of opening (and AUTHing) a socket per request
+REDIS_POOL = aioredis.ConnectionPool.from_url(REDIS_URL, decode_responses=True, max_connections=100)
+redis_client = aioredis.Redis(connection_pool=REDIS_POOL)
+
+
+async def publish_update(claim_id: str, message: dict):
+    """Publish real-time update to the specific claim channel"""
+    channel = f"claim_updates:{claim_id}"
+    try:
+        await redis_client.publish(channel, json.dumps(message))
+    except Exception as e:
+        logger.error(f"Failed to publish update: {e}")
+
 @router.post("/", response_model=ClaimResponse, status_code=status.HTTP_201_CREATED)
-async def create_claim(claim: ClaimCreate, db: Session = Depends(get_db)):
+async def create_claim(claim: ClaimCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new claim"""
-    # Import PolicyHolder here to avoid circular imports
-    from app.models import PolicyHolder
-    
     # Validate policy holder exists
-    policy_holder = db.query(PolicyHolder).filter(
-        PolicyHolder.policy_holder_id == claim.policy_holder_id
-    ).first()
+    policy_holder = (await db.execute(
+        select(PolicyHolder).where(PolicyHolder.policy_holder_id == claim.policy_holder_id)
+    )).scalar_one_or_none()
     
     if not policy_holder:
         raise HTTPException(
@@ -45,13 +56,14 @@ async def create_claim(claim: ClaimCreate, db: Session = Depends(get_db)):
     # Generate claim ID using atomic PostgreSQL sequence
     # This is O(1), thread-safe, and prevents race conditions
     from app.utils.id_generator import generate_claim_id
-    claim_id = generate_claim_id(db)
+    claim_id = await db.run_sync(generate_claim_id)
     
+    now = utc_now()
     db_claim = Claim(
         claim_id=claim_id,
         policy_holder_id=claim.policy_holder_id,
         policy_holder_name=policy_holder.policy_holder_name,
-        treatment_date=claim.treatment_date or datetime.utcnow(),
+        treatment_date=claim.treatment_date or now,
         treatment_type=claim.treatment_type,
         treatment_category=claim.treatment_type,  # Same as type for now
         claimed_amount=claim.claimed_amount,
@@ -60,49 +72,98 @@ async def create_claim(claim: ClaimCreate, db: Session = Depends(get_db)):
         doctor_name=claim.doctor_name,
         doctor_registration_number=claim.doctor_registration_number,
         diagnosis=claim.diagnosis,
-        submission_date=datetime.utcnow(),
+        submission_date=now,
         status="pending"
     )
     db.add(db_claim)
-    db.commit()
-    db.refresh(db_claim)
+    await db.commit()
     return db_claim
 
-@router.get("/", response_model=List[ClaimResponse])
-async def list_claims(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all claims"""
-    claims = db.query(Claim).offset(skip).limit(limit).all()
-    return claims
+def _encode_claim_cursor(submission_date: datetime, claim_id: str) -> str:
+    return f"{submission_date.isoformat()}|{claim_id}"
+
+
+def _decode_claim_cursor(cursor: str):
+    try:
+        submission_date, claim_id = cursor.split("|", 1)
+        return datetime.fromisoformat(submission_date), claim_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/", response_model=List[ClaimListItem])
+async def list_claims(
+    response: Response,
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    List claims, newest first (summary columns only; use GET /{claim_id} for full detail)
+    
+    Keyset-paginated on (submission_date, claim_id): when more rows may
+    follow, the X-Next-Cursor response header holds the value to pass as
+    `after` for the next page.
+    """
+    stmt = select(
+        Claim.claim_id,
+        Claim.policy_holder_id,
+        Claim.policy_holder_name,
+        Claim.treatment_type,
+        Claim.claimed_amount,
+        Claim.approved_amount,
+        Claim.status,
+        Claim.decision,
+        Claim.submission_date
+    )
+    if after:
+        stmt = stmt.where(
+            tuple_(Claim.submission_date, Claim.claim_id) < _decode_claim_cursor(after)
+        )
+    rows = (await db.execute(
+        stmt.order_by(Claim.submission_date.desc(), Claim.claim_id.desc()).limit(limit)
+    )).all()
+    
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = _encode_claim_cursor(last.submission_date, last.claim_id)
+    return rows
 
 @router.get("/{claim_id}", response_model=ClaimResponse)
-async def get_claim(claim_id: str, db: Session = Depends(get_db)):
+async def get_claim(claim_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specific claim by ID"""
-    claim = db.query(Claim).filter(Claim.claim_id == claim_id).first()
+    claim = (await db.execute(
+        select(Claim).where(Claim.claim_id == claim_id)
+    )).scalar_one_or_none()
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
     return claim
 
 @router.post("/{claim_id}/adjudicate", response_model=AdjudicationResult)
-async def adjudicate_claim(claim_id: str, db: Session = Depends(get_db)):
+async def adjudicate_claim(claim_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Trigger adjudication for a claim
     
     Uses the unified AdjudicationEngine (same as Celery worker)
     to ensure consistent adjudication logic
     """
-    claim = db.query(Claim).filter(Claim.claim_id == claim_id).first()
+    # Load claim, policy holder and documents together
+    # (policy holder joined, documents via a single SELECT ... IN)
+    claim = (await db.execute(
+        select(Claim)
+        .options(joinedload(Claim.policy_holder), selectinload(Claim.documents))
+        .where(Claim.claim_id == claim_id)
+    )).scalar_one_or_none()
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
     
     # Get policy holder
-    policy_holder = db.query(PolicyHolder).filter(
-        PolicyHolder.policy_holder_id == claim.policy_holder_id
-    ).first()
+    policy_holder = claim.policy_holder
     if not policy_holder:
         raise HTTPException(status_code=404, detail="Policy holder not found")
     
     # Get documents for this claim
-    documents = db.query(Document).filter(Document.claim_id == claim_id).all()
+    documents = claim.documents
     if not documents:
         raise HTTPException(status_code=400, detail="No documents found for claim")
     
@@ -115,20 +176,26 @@ async def adjudicate_claim(claim_id: str, db: Session = Depends(get_db)):
     if not extracted_data:
         raise HTTPException(status_code=400, detail="No extracted data available")
     
-    # Update status to processing
+    # Update status to processing. Not committed on its own: SSE
+    # subscribers are told via Redis and the final commit below persists
+    # the outcome in one transaction.
     claim.status = "processing"
-    db.commit()
+    await publish_update(claim_id, {
+        "type": "claim_status",
+        "claim_id": claim_id,
+        "status": "processing"
+    })
     
     # Initialize unified adjudication engine
-    from app.services.adjudication_engine import AdjudicationEngine
-    engine = AdjudicationEngine()
+    from app.services.adjudication_engine import get_adjudication_engine
+    engine = get_adjudication_engine()
     
     # Build comprehensive policy context (runtime only)
     policy_context = {
         "policy_holder_id": policy_holder.policy_holder_id,
         "policy_holder_name": policy_holder.policy_holder_name,
         "dob": policy_holder.dob,
-        "policy_status": policy_holder.policy_status.value if hasattr(policy_holder.policy_status, 'value') else str(policy_holder.policy_status),
+        "policy_status": policy_holder.policy_status_str,
         "policy_start_date": policy_holder.policy_start_date.isoformat() if policy_holder.policy_start_date else None,
         "join_date": policy_holder.join_date.isoformat() if policy_holder.join_date else None,
         "annual_limit": policy_holder.annual_limit,
@@ -148,6 +215,26 @@ async def adjudicate_claim(claim_id: str, db: Session = Depends(get_db)):
     # Run adjudication using unified engine
     decision = await engine.adjudicate_claim(claim_id, adjudication_context)
     
+    if decision.decision == DecisionType.APPROVED:
+        # Consume the annual limit atomically: the engine saw a snapshot
+        # of annual_limit_used, so a concurrent adjudication for the same
+        # policy holder may have spent it since. The guarded UPDATE only
+        # row-locks this policy holder, and only for this transaction.
+        result = await db.execute(
+            update(PolicyHolder)
+            .where(
+                PolicyHolder.policy_holder_id == policy_holder.policy_holder_id,
+                PolicyHolder.annual_limit - PolicyHolder.annual_limit_used >= decision.approved_amount
+            )
+            .values(annual_limit_used=PolicyHolder.annual_limit_used + decision.approved_amount)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            logger.warning(f"⚠️ Annual limit for {policy_holder.policy_holder_id} exhausted concurrently; routing {claim_id} to manual review")
+            decision.decision = DecisionType.MANUAL_REVIEW
+            decision.approved_amount = 0.0
+            decision.notes = f"{decision.notes or ''}\nAnnual limit was consumed by another claim during adjudication.".strip()
+    
     # Update claim with decision
     claim.decision = decision.decision
     claim.approved_amount = decision.approved_amount
@@ -162,18 +249,15 @@ async def adjudicate_claim(claim_id: str, db: Session = Depends(get_db)):
     # Update status based on decision
     if decision.decision == DecisionType.APPROVED:
         claim.status = "approved"
-        # Update policy holder's annual limit used
-        policy_holder.annual_limit_used += decision.approved_amount
     elif decision.decision == DecisionType.REJECTED:
         claim.status = "rejected"
     elif decision.decision == DecisionType.MANUAL_REVIEW:
         claim.status = "under_review"
     
     # Set processed timestamp
-    claim.processed_at = datetime.utcnow()
+    claim.processed_at = utc_now()
     
-    db.commit()
-    db.refresh(claim)
+    await db.commit()
     
     # Convert ClaimDecision to AdjudicationResult for API response
     return AdjudicationResult(
@@ -190,14 +274,16 @@ async def adjudicate_claim(claim_id: str, db: Session = Depends(get_db)):
     )
 
 @router.delete("/{claim_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_claim(claim_id: str, db: Session = Depends(get_db)):
+async def delete_claim(claim_id: str, db: AsyncSession = Depends(get_async_db)):
     """Delete a claim"""
-    claim = db.query(Claim).filter(Claim.claim_id == claim_id).first()
+    claim = (await db.execute(
+        select(Claim).where(Claim.claim_id == claim_id)
+    )).scalar_one_or_none()
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
     
-    db.delete(claim)
-    db.commit()
+    await db.delete(claim)
+    await db.commit()
     return None
 
 @router.get("/{claim_id}/stream")
@@ -206,11 +292,9 @@ async def stream_claim_updates(claim_id: str, request: Request):
     
     async def event_generator():
         # Connect to Redis
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        r = redis.from_url(redis_url, decode_responses=True)
-        pubsub = r.pubsub()
+        pubsub = redis_client.pubsub()
         channel = f"claim_updates:{claim_id}"
-        pubsub.subscribe(channel)
+        await pubsub.subscribe(channel)
         
         logger.info(f"🔌 SSE client connected to {channel}")
         
@@ -227,9 +311,9 @@ async def stream_claim_updates(claim_id: str, request: Request):
                     logger.info(f"🔌 SSE client disconnected from {channel}")
                     break
                 
-                # FIXED: Use listen() with timeout instead of get_message()
-                # This properly blocks and waits for messages
-                message = pubsub.get_message(timeout=1.0)
+                # Awaits the socket without blocking the event loop; the
+                # timeout only sets the disconnect-check cadence
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
                 
                 if message and message['type'] == 'message':
                     logger.info(f"📨 SSE sending: {message['data']}")
@@ -238,16 +322,13 @@ async def stream_claim_updates(claim_id: str, request: Request):
                         "data": message["data"]
                     }
                 
-                # Small sleep to prevent CPU spinning
-                await asyncio.sleep(0.1)
-                
         except Exception as e:
             logger.error(f"❌ SSE error: {e}")
         finally:
             try:
-                pubsub.unsubscribe(channel)
-                pubsub.close()
-                r.close()
+                await pubsub.unsubscribe(channel)
+                # Returns the connection to the shared pool (pool stays open)
+                await pubsub.aclose()
                 logger.info(f"🔌 SSE connection closed for {channel}")
             except:
                 pass
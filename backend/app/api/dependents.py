@@ -2,14 +2,16 @@
 Dependents API - Manage family members under a policy holder
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from datetime import datetime
 import uuid
 
 from app.schemas import DependentCreate, DependentResponse
 from app.models import Dependent, PolicyHolder
-from app.utils.database import get_db
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
+from app.utils.id_generator import generate_dependent_id
 
 router = APIRouter()
 
@@ -17,30 +19,20 @@ router = APIRouter()
 async def create_dependent(
     policy_holder_id: str,
     dependent: DependentCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Add a dependent to a policy holder"""
-    # Verify policy holder exists
-    policy_holder = db.query(PolicyHolder).filter(
-        PolicyHolder.policy_holder_id == policy_holder_id
-    ).first()
+    # Verify policy holder exists (unique-index probe, no columns fetched)
+    policy_holder_exists = (await db.execute(
+        select(1).where(PolicyHolder.policy_holder_id == policy_holder_id)
+    )).scalar()
     
-    if not policy_holder:
+    if not policy_holder_exists:
         raise HTTPException(status_code=404, detail="Policy holder not found")
     
-    # Generate auto-increment dependent ID
-    last_dependent = db.query(Dependent).order_by(Dependent.id.desc()).first()
-    
-    if last_dependent and last_dependent.dependent_id.startswith("DEP"):
-        try:
-            last_number = int(last_dependent.dependent_id[3:])
-            next_number = last_number + 1
-        except ValueError:
-            next_number = 1
-    else:
-        next_number = 1
-    
-    dependent_id = f"DEP{next_number:06d}"  # Format: DEP000001
+    # Generate dependent ID using atomic PostgreSQL sequence
+    # This is O(1), thread-safe, and prevents race conditions
+    dependent_id = await db.run_sync(generate_dependent_id)  # Format: DEP000001
     
     db_dependent = Dependent(
         dependent_id=dependent_id,
@@ -49,28 +41,36 @@ async def create_dependent(
         relationship_type=dependent.relationship_type,
         date_of_birth=dependent.date_of_birth,
         gender=dependent.gender,
-        created_at=datetime.utcnow()
+        created_at=utc_now()
     )
     
     db.add(db_dependent)
-    db.commit()
-    db.refresh(db_dependent)
+    await db.commit()
     return db_dependent
 
 @router.get("/", response_model=List[DependentResponse])
-async def list_dependents(policy_holder_id: str, db: Session = Depends(get_db)):
+async def list_dependents(policy_holder_id: str, db: AsyncSession = Depends(get_async_db)):
     """List all dependents for a policy holder"""
-    dependents = db.query(Dependent).filter(
-        Dependent.policy_holder_id == policy_holder_id
-    ).all()
+    # Plain rows of just the response columns - no ORM objects to track
+    dependents = (await db.execute(
+        select(
+            Dependent.id,
+            Dependent.dependent_id,
+            Dependent.policy_holder_id,
+            Dependent.dependent_name,
+            Dependent.relationship_type,
+            Dependent.date_of_birth,
+            Dependent.gender
+        ).where(Dependent.policy_holder_id == policy_holder_id)
+    )).all()
     return dependents
 
 @router.get("/{dependent_id}", response_model=DependentResponse)
-async def get_dependent(dependent_id: str, db: Session = Depends(get_db)):
+async def get_dependent(dependent_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specific dependent"""
-    dependent = db.query(Dependent).filter(
-        Dependent.dependent_id == dependent_id
-    ).first()
+    dependent = (await db.execute(
+        select(Dependent).where(Dependent.dependent_id == dependent_id)
+    )).scalar_one_or_none()
     
     if not dependent:
         raise HTTPException(status_code=404, detail="Dependent not found")
@@ -78,15 +78,15 @@ async def get_dependent(dependent_id: str, db: Session = Depends(get_db)):
     return dependent
 
 @router.delete("/{dependent_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_dependent(dependent_id: str, db: Session = Depends(get_db)):
+async def delete_dependent(dependent_id: str, db: AsyncSession = Depends(get_async_db)):
     """Remove a dependent"""
-    dependent = db.query(Dependent).filter(
-        Dependent.dependent_id == dependent_id
-    ).first()
+    dependent = (await db.execute(
+        select(Dependent).where(Dependent.dependent_id == dependent_id)
+    )).scalar_one_or_none()
     
     if not dependent:
         raise HTTPException(status_code=404, detail="Dependent not found")
     
-    db.delete(dependent)
-    db.commit()
+    await db.delete(dependent)
+    await db.commit()
     return None
@@ -2,12 +2,13 @@
 Document Processing API - Celery-based async processing
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import logging
 
 from app.models import Document
-from app.utils.database import get_db
+from app.utils.database import get_async_db
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 @router.post("/{file_id}/process")
 async def process_document(
     file_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Trigger OCR processing via Celery worker
@@ -25,13 +26,15 @@ async def process_document(
     - Frontend polls /api/documents/status for updates
     """
     # Get document record
-    document = db.query(Document).filter(Document.document_id == file_id).first()
+    document = (await db.execute(
+        select(Document).where(Document.document_id == file_id)
+    )).scalar_one_or_none()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
     # Update status to queued
     document.status = "processing"
-    db.commit()
+    await db.commit()
     
     # Dispatch to Celery worker (non-blocking)
     try:
@@ -56,5 +59,5 @@ async def process_document(
         logger.error(f"Failed to queue task: {e}")
         document.status = "failed"
         document.error_message = f"Failed to queue: {str(e)}"
-        db.commit()
+        await db.commit()
         raise HTTPException(status_code=500, detail=f"Failed to queue task: {str(e)}")
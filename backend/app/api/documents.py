@@ -1,74 +1,96 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-import uuid
 import os
-from datetime import datetime
+import secrets
+import aiofiles
+import aiofiles.os
 
 from app.schemas import DocumentResponse
 from app.models import Document, Claim
-from app.utils.database import get_db
-from app.services.document_processor import DocumentProcessor
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 from app.config import settings
 
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
 @router.post("/{claim_id}/upload", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
     claim_id: str,
     document_type: str,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload a document for a claim"""
-    # Verify claim exists
-    claim = db.query(Claim).filter(Claim.claim_id == claim_id).first()
-    if not claim:
+    # Verify claim exists (unique-index probe, no columns fetched)
+    claim_exists = (await db.execute(
+        select(1).where(Claim.claim_id == claim_id)
+    )).scalar()
+    if not claim_exists:
         raise HTTPException(status_code=404, detail="Claim not found")
     
-    # Validate file size
-    file_content = await file.read()
-    if len(file_content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(status_code=400, detail="File too large")
-    
     # Save file
     file_extension = os.path.splitext(file.filename)[1]
-    document_id = f"DOC_{uuid.uuid4().hex[:8].upper()}"
+    document_id = f"DOC_{secrets.token_hex(8).upper()}"
     file_path = os.path.join(settings.UPLOAD_DIR, f"{document_id}{file_extension}")
     
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    with open(file_path, "wb") as f:
-        f.write(file_content)
     
-    # Process document
-    processor = DocumentProcessor()
-    extracted_data = await processor.process_document(file_path, document_type)
+    # Stream to disk in 1MB chunks, enforcing the size limit as we go,
+    # so at most one chunk per upload is held in memory
+    total_size = 0
+    async with aiofiles.open(file_path, "wb") as out:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            if total_size > settings.MAX_UPLOAD_SIZE:
+                break
+            await out.write(chunk)
+    
+    # Validate file size
+    if total_size > settings.MAX_UPLOAD_SIZE:
+        await aiofiles.os.remove(file_path)
+        raise HTTPException(status_code=400, detail="File too large")
     
-    # Create document record
+    # Create document record; OCR runs in the Celery worker
     db_document = Document(
         document_id=document_id,
         claim_id=claim_id,
         document_type=document_type,
         file_path=file_path,
-        extracted_data=extracted_data,
-        created_at=datetime.utcnow()
+        status="pending",
+        extracted_data={},
+        created_at=utc_now()
     )
     db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    await db.commit()
+    
+    # Dispatch to Celery worker (non-blocking)
+    from app.worker import process_document_task
+    process_document_task.delay(
+        file_id=document_id,
+        file_path=file_path,
+        document_type=document_type
+    )
     
     return db_document
 
 @router.get("/{claim_id}", response_model=List[DocumentResponse])
-async def list_documents(claim_id: str, db: Session = Depends(get_db)):
+async def list_documents(claim_id: str, db: AsyncSession = Depends(get_async_db)):
     """List all documents for a claim"""
-    documents = db.query(Document).filter(Document.claim_id == claim_id).all()
+    documents = (await db.execute(
+        select(Document).where(Document.claim_id == claim_id)
+    )).scalars().all()
     return documents
 
 @router.get("/document/{document_id}", response_model=DocumentResponse)
-async def get_document(document_id: str, db: Session = Depends(get_db)):
+async def get_document(document_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specific document"""
-    document = db.query(Document).filter(Document.document_id == document_id).first()
+    document = (await db.execute(
+        select(Document).where(Document.document_id == document_id)
+    )).scalar_one_or_none()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     return document
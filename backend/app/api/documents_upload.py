@@ -2,14 +2,17 @@
 Enhanced Document Upload API with Auto-Classification
 """
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
-import uuid
 import logging
+import os
+import secrets
 
-from app.utils.database import get_db
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 from app.services.minio_service import get_storage_service
 from app.services.document_classifier import DocumentClassifier
 from app.models.models import Document, Claim
@@ -17,6 +20,16 @@ from app.models.models import Document, Claim
 router = APIRouter(prefix="/api/documents", tags=["documents"])
 logger = logging.getLogger(__name__)
 
+# Extension -> Content-Type, built once at import
+CONTENT_TYPE_MAP = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+}
+
 
 class DocumentUploadRequest(BaseModel):
     claim_id: str
@@ -45,10 +58,39 @@ class DocumentStatusResponse(BaseModel):
     extracted_data: Optional[dict]
 
 
+# Columns read by the status endpoints (polled by the frontend), selected
+# as plain rows: no ORM hydration and no ocr_text payload
+STATUS_COLUMNS = (
+    Document.document_id,
+    Document.file_path,
+    Document.document_type,
+    Document.status,
+    Document.created_at,
+    Document.extracted_data
+)
+
+
+def _status_response(row) -> DocumentStatusResponse:
+    # Documents have no processing timestamps, confidence score or error
+    # message columns, so those fields are always null
+    return DocumentStatusResponse(
+        file_id=row.document_id,
+        filename=row.file_path.split('/')[-1] if row.file_path else "unknown",
+        document_type=row.document_type or "other",
+        status=row.status or "uploaded",
+        uploaded_at=row.created_at,
+        processing_started_at=None,
+        processing_completed_at=None,
+        confidence_score=None,
+        error_message=None,
+        extracted_data=row.extracted_data
+    )
+
+
 @router.post("/upload", response_model=DocumentUploadResponse)
 async def upload_document(
     request: DocumentUploadRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate presigned URL for document upload with auto-classification
@@ -57,9 +99,11 @@ async def upload_document(
     - Auto-classifies document type if not provided
     - Organizes files in MinIO: claims/{claim_id}/{doc_type}/{file_id}.ext
     """
-    # Verify claim exists
-    claim = db.query(Claim).filter(Claim.claim_id == request.claim_id).first()
-    if not claim:
+    # Verify claim exists (unique-index probe, no columns fetched)
+    claim_exists = (await db.execute(
+        select(1).where(Claim.claim_id == request.claim_id)
+    )).scalar()
+    if not claim_exists:
         raise HTTPException(status_code=404, detail=f"Claim {request.claim_id} not found")
     
     # Auto-classify document type if needed
@@ -71,25 +115,17 @@ async def upload_document(
         doc_type = request.document_type
     
     # Generate unique file ID
-    file_id = f"DOC{uuid.uuid4().hex[:10].upper()}"
+    # 64 random bits: truncated UUIDs (40 bits) collide at ~1M documents
+    file_id = f"DOC{secrets.token_hex(8).upper()}"
     
     # Get file extension
-    import os
     file_ext = os.path.splitext(request.filename)[1]
     
     # Create object path: claims/{claim_id}/{doc_type}/{file_id}.ext
     object_name = f"claims/{request.claim_id}/{doc_type}/{file_id}{file_ext}"
     
     # Determine content type
-    content_type_map = {
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.png': 'image/png',
-        '.pdf': 'application/pdf',
-        '.doc': 'application/msword',
-        '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-    }
-    content_type = content_type_map.get(file_ext.lower(), 'application/octet-stream')
+    content_type = CONTENT_TYPE_MAP.get(file_ext.lower(), 'application/octet-stream')
     
     # Generate presigned URL
     try:
@@ -109,12 +145,11 @@ async def upload_document(
         file_url=upload_url.split('?')[0],  # Store URL without query params
         document_type=doc_type,
         status="uploaded",
-        created_at=datetime.utcnow()
+        created_at=utc_now()
     )
     
     db.add(document)
-    db.commit()
-    db.refresh(document)
+    await db.commit()
     
     return DocumentUploadResponse(
         file_id=file_id,
@@ -128,51 +163,30 @@ async def upload_document(
 @router.get("/status", response_model=list[DocumentStatusResponse])
 async def get_documents_status(
     claim_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get status of all documents for a claim
     Used by frontend for real-time polling
     """
-    documents = db.query(Document).filter(Document.claim_id == claim_id).all()
+    rows = (await db.execute(
+        select(*STATUS_COLUMNS).where(Document.claim_id == claim_id)
+    )).all()
     
-    return [
-        DocumentStatusResponse(
-            file_id=doc.document_id,
-            filename=doc.file_path.split('/')[-1] if doc.file_path else "unknown",
-            document_type=doc.document_type or "other",
-            status=doc.status or "uploaded",
-            uploaded_at=doc.created_at,
-            processing_started_at=getattr(doc, 'processing_started_at', None),
-            processing_completed_at=getattr(doc, 'processing_completed_at', None),
-            confidence_score=getattr(doc, 'confidence_score', None),
-            error_message=getattr(doc, 'error_message', None),
-            extracted_data=doc.extracted_data
-        )
-        for doc in documents
-    ]
+    return [_status_response(row) for row in rows]
 
 
 @router.get("/{file_id}", response_model=DocumentStatusResponse)
 async def get_document_status(
     file_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get status of a specific document"""
-    document = db.query(Document).filter(Document.document_id == file_id).first()
+    row = (await db.execute(
+        select(*STATUS_COLUMNS).where(Document.document_id == file_id)
+    )).first()
     
-    if not document:
+    if not row:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    return DocumentStatusResponse(
-        file_id=document.document_id,
-        filename=document.file_path.split('/')[-1] if document.file_path else "unknown",
-        document_type=document.document_type or "other",
-        status=document.status or "uploaded",
-        uploaded_at=document.created_at,
-        processing_started_at=getattr(document, 'processing_started_at', None),
-        processing_completed_at=getattr(document, 'processing_completed_at', None),
-        confidence_score=getattr(document, 'confidence_score', None),
-        error_message=getattr(document, 'error_message', None),
-        extracted_data=document.extracted_data
-    )
+    return _status_response(row)
@@ -1,33 +1,42 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, List
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from app.models import Claim, DecisionType
-from app.utils.database import get_db
+from app.utils.cache import redis_cached
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 
 router = APIRouter()
 
+# Dashboard trend windows are served from Redis for a minute; daily claim
+# counts do not need to be real-time
+TRENDS_CACHE_TTL = 60  # seconds
+TRENDS_CACHED_DAYS = {7, 30}
+
 @router.get("/accuracy")
-async def get_accuracy_metrics(db: Session = Depends(get_db)):
+async def get_accuracy_metrics(db: AsyncSession = Depends(get_async_db)):
     """Get AI accuracy metrics"""
-    total_decisions = db.query(func.count(Claim.id)).filter(
-        Claim.decision.isnot(None)
-    ).scalar()
-    
-    high_confidence = db.query(func.count(Claim.id)).filter(
-        Claim.confidence_score >= 0.8
-    ).scalar()
-    
-    medium_confidence = db.query(func.count(Claim.id)).filter(
-        Claim.confidence_score >= 0.5,
-        Claim.confidence_score < 0.8
-    ).scalar()
-    
-    low_confidence = db.query(func.count(Claim.id)).filter(
-        Claim.confidence_score < 0.5
-    ).scalar()
+    # One round-trip: COUNT(*) FILTER (WHERE ...) per bucket over decided
+    # claims (confidence is only scored on adjudication), which the
+    # ix_claims_decided_confidence partial index answers index-only
+    row = (await db.execute(
+        select(
+            func.count().label('total'),
+            func.count().filter(Claim.confidence_score >= 0.8).label('high'),
+            func.count().filter(
+                Claim.confidence_score >= 0.5,
+                Claim.confidence_score < 0.8
+            ).label('medium'),
+            func.count().filter(Claim.confidence_score < 0.5).label('low')
+        ).where(Claim.decision.isnot(None))
+    )).one()
+    total_decisions = row.total
+    high_confidence = row.high
+    medium_confidence = row.medium
+    low_confidence = row.low
     
     return {
         "total_decisions": total_decisions,
@@ -38,12 +47,14 @@ async def get_accuracy_metrics(db: Session = Depends(get_db)):
     }
 
 @router.get("/decision-distribution")
-async def get_decision_distribution(db: Session = Depends(get_db)):
+async def get_decision_distribution(db: AsyncSession = Depends(get_async_db)):
     """Get distribution of decision types"""
-    decisions = db.query(
-        Claim.decision,
-        func.count(Claim.id).label('count')
-    ).group_by(Claim.decision).all()
+    decisions = (await db.execute(
+        select(
+            Claim.decision,
+            func.count(Claim.id).label('count')
+        ).group_by(Claim.decision)
+    )).all()
     
     return {
         "distribution": [
@@ -53,7 +64,7 @@ async def get_decision_distribution(db: Session = Depends(get_db)):
     }
 
 @router.get("/processing-time")
-async def get_processing_time_metrics(db: Session = Depends(get_db)):
+async def get_processing_time_metrics(db: AsyncSession = Depends(get_async_db)):
     """Get processing time statistics"""
     # This is a placeholder - in production, you'd track actual processing times
     return {
@@ -64,18 +75,29 @@ async def get_processing_time_metrics(db: Session = Depends(get_db)):
     }
 
 @router.get("/trends")
-async def get_trends(days: int = 7, db: Session = Depends(get_db)):
+@redis_cached(
+    lambda days, **_: f"metrics:trends:v1:{days}" if days in TRENDS_CACHED_DAYS else None,
+    ttl=TRENDS_CACHE_TTL
+)
+async def get_trends(days: int = 7, db: AsyncSession = Depends(get_async_db)):
     """Get claim trends over time"""
-    start_date = datetime.utcnow() - timedelta(days=days)
+    # Filter and group on the same date(created_at) expression so the
+    # ix_claims_created_date expression index answers both, index-only
+    created_date = func.date(Claim.created_at)
+    start_date = (utc_now() - timedelta(days=days)).date()
     
-    daily_claims = db.query(
-        func.date(Claim.created_at).label('date'),
-        func.count(Claim.id).label('count')
-    ).filter(
-        Claim.created_at >= start_date
-    ).group_by(
-        func.date(Claim.created_at)
-    ).all()
+    daily_claims = (await db.execute(
+        select(
+            created_date.label('date'),
+            func.count().label('count')
+        ).where(
+            created_date >= start_date
+        ).group_by(
+            created_date
+        ).order_by(
+            created_date
+        )
+    )).all()
     
     return {
         "period_days": days,
@@ -86,7 +108,7 @@ async def get_trends(days: int = 7, db: Session = Depends(get_db)):
     }
 
 @router.get("/confusion-matrix")
-async def get_confusion_matrix(db: Session = Depends(get_db)):
+async def get_confusion_matrix(db: AsyncSession = Depends(get_async_db)):
     """Get confusion matrix for AI decisions (requires ground truth data)"""
     # Placeholder - in production, you'd compare AI decisions with manual review outcomes
     return {
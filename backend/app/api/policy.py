@@ -1,27 +1,43 @@
 from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+from typing import Any, Dict, Optional
 import json
 import os
 
 router = APIRouter()
 
-@router.get("/terms")
-async def get_policy_terms():
-    """Get policy terms and conditions"""
-    # Load policy terms from JSON file
-    policy_file = os.path.join(os.path.dirname(__file__), "..", "..", "policy_terms.json")
+POLICY_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "policy_terms.json")
+
+
+@lru_cache(maxsize=1)
+def _load_policy_terms() -> Optional[Dict[str, Any]]:
+    """Read and parse policy_terms.json once per process (None if missing)"""
+    if not os.path.exists(POLICY_FILE):
+        return None
     
-    if not os.path.exists(policy_file):
-        raise HTTPException(status_code=404, detail="Policy terms not found")
+    with open(POLICY_FILE, "r") as f:
+        return json.load(f)
+
+
+def _policy_terms() -> Dict[str, Any]:
+    """Cached policy terms, or 404 if the file is missing"""
+    policy_terms = _load_policy_terms()
     
-    with open(policy_file, "r") as f:
-        policy_terms = json.load(f)
+    if policy_terms is None:
+        raise HTTPException(status_code=404, detail="Policy terms not found")
     
     return policy_terms
 
+@router.get("/terms")
+async def get_policy_terms():
+    """Get policy terms and conditions"""
+    # Load policy terms from JSON file (cached; the file ships with the app)
+    return _policy_terms()
+
 @router.get("/coverage/{category}")
 async def get_coverage_details(category: str):
     """Get coverage details for a specific category"""
-    policy_terms = await get_policy_terms()
+    policy_terms = _policy_terms()
     
     if category not in policy_terms.get("coverage_details", {}):
         raise HTTPException(status_code=404, detail=f"Category '{category}' not found")
@@ -31,5 +47,5 @@ async def get_coverage_details(category: str):
 @router.get("/exclusions")
 async def get_exclusions():
     """Get list of policy exclusions"""
-    policy_terms = await get_policy_terms()
+    policy_terms = _policy_terms()
     return {"exclusions": policy_terms.get("exclusions", [])}
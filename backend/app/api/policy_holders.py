@@ -1,21 +1,25 @@
 """
 PolicyHolder API - CRUD operations for Insureho policy holders
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from datetime import datetime
 
 from app.schemas import PolicyHolderCreate, PolicyHolderResponse
 from app.models import PolicyHolder
-from app.utils.database import get_db
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
+from app.utils.id_generator import generate_policy_holder_id
 
 router = APIRouter()
 
 @router.post("/", response_model=PolicyHolderResponse, status_code=201)
 async def create_policy_holder(
     policy_holder: PolicyHolderCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new policy holder
@@ -25,51 +29,27 @@ async def create_policy_holder(
     try:
         # Generate policy holder ID if not provided
         if not policy_holder.policy_holder_id:
-            # Get all policy holders with PH prefix and find the max number
-            all_holders = db.query(PolicyHolder).filter(
-                PolicyHolder.policy_holder_id.like("PH%")
-            ).all()
-            
-            max_number = 0
-            for holder in all_holders:
-                try:
-                    # Extract number from PH000001 format
-                    if holder.policy_holder_id.startswith("PH") and len(holder.policy_holder_id) > 2:
-                        number = int(holder.policy_holder_id[2:])
-                        max_number = max(max_number, number)
-                except (ValueError, IndexError):
-                    continue
-            
-            next_number = max_number + 1
-            generated_id = f"PH{next_number:06d}"  # Format: PH000001
+            # Atomic PostgreSQL sequence: O(1), no scan of existing IDs,
+            # and concurrent creates never compute the same number
+            generated_id = await db.run_sync(generate_policy_holder_id)  # Format: PH000001
         else:
             generated_id = policy_holder.policy_holder_id
         
-        # Check if policy holder already exists
-        existing = db.query(PolicyHolder).filter(
-            PolicyHolder.policy_holder_id == generated_id
-        ).first()
-        
-        if existing:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Policy holder with ID {generated_id} already exists"
-            )
-        
         # Parse date strings to datetime objects
-        join_date = datetime.utcnow()
+        now = utc_now()
+        join_date = now
         if policy_holder.join_date:
             try:
                 join_date = datetime.fromisoformat(policy_holder.join_date.replace('Z', '+00:00'))
             except:
-                join_date = datetime.utcnow()
+                join_date = now
         
-        policy_start_date = datetime.utcnow()
+        policy_start_date = now
         if policy_holder.policy_start_date:
             try:
                 policy_start_date = datetime.fromisoformat(policy_holder.policy_start_date.replace('Z', '+00:00'))
             except:
-                policy_start_date = datetime.utcnow()
+                policy_start_date = now
         
         db_policy_holder = PolicyHolder(
             policy_holder_id=generated_id,
@@ -84,37 +64,63 @@ async def create_policy_holder(
             annual_limit=policy_holder.annual_limit if policy_holder.annual_limit is not None else 50000.0,
             annual_limit_used=policy_holder.annual_limit_used if policy_holder.annual_limit_used is not None else 0.0,
             pre_existing_conditions=policy_holder.pre_existing_conditions or [],
-            created_at=datetime.utcnow()
+            created_at=now
         )
         db.add(db_policy_holder)
-        db.commit()
-        db.refresh(db_policy_holder)
+        await db.commit()
         return db_policy_holder
     
+    except IntegrityError:
+        # Unique index on policy_holder_id (or email) rejected the insert;
+        # no pre-insert SELECT, so concurrent creates cannot race past it
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Policy holder with ID {generated_id} or email {policy_holder.email} already exists"
+        )
     except HTTPException:
         raise
     except Exception as e:
         print(f"❌ ERROR creating policy holder: {type(e).__name__}: {str(e)}")
         import traceback
         traceback.print_exc()
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Error creating policy holder: {str(e)}"
         )
 
 @router.get("/", response_model=List[PolicyHolderResponse])
-async def list_policy_holders(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all policy holders"""
-    policy_holders = db.query(PolicyHolder).offset(skip).limit(limit).all()
+async def list_policy_holders(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    List policy holders ordered by policy_holder_id
+    
+    Keyset-paginated on the unique policy_holder_id index: when more rows
+    may follow, the X-Next-Cursor response header holds the value to pass
+    as `cursor` for the next page.
+    """
+    stmt = select(PolicyHolder)
+    if cursor:
+        stmt = stmt.where(PolicyHolder.policy_holder_id > cursor)
+    policy_holders = (await db.execute(
+        stmt.order_by(PolicyHolder.policy_holder_id).limit(limit)
+    )).scalars().all()
+    
+    if len(policy_holders) == limit:
+        response.headers["X-Next-Cursor"] = policy_holders[-1].policy_holder_id
     return policy_holders
 
 @router.get("/{policy_holder_id}", response_model=PolicyHolderResponse)
-async def get_policy_holder(policy_holder_id: str, db: Session = Depends(get_db)):
+async def get_policy_holder(policy_holder_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specific policy holder by ID"""
-    policy_holder = db.query(PolicyHolder).filter(
-        PolicyHolder.policy_holder_id == policy_holder_id
-    ).first()
+    policy_holder = (await db.execute(
+        select(PolicyHolder).where(PolicyHolder.policy_holder_id == policy_holder_id)
+    )).scalar_one_or_none()
     
     if not policy_holder:
         raise HTTPException(status_code=404, detail="Policy holder not found")
@@ -125,34 +131,33 @@ async def get_policy_holder(policy_holder_id: str, db: Session = Depends(get_db)
 async def update_policy_holder(
     policy_holder_id: str,
     policy_holder_update: PolicyHolderCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a policy holder"""
-    db_policy_holder = db.query(PolicyHolder).filter(
-        PolicyHolder.policy_holder_id == policy_holder_id
-    ).first()
+    db_policy_holder = (await db.execute(
+        select(PolicyHolder).where(PolicyHolder.policy_holder_id == policy_holder_id)
+    )).scalar_one_or_none()
     
     if not db_policy_holder:
         raise HTTPException(status_code=404, detail="Policy holder not found")
     
     db_policy_holder.policy_holder_name = policy_holder_update.policy_holder_name
     db_policy_holder.join_date = policy_holder_update.join_date
-    db_policy_holder.updated_at = datetime.utcnow()
+    db_policy_holder.updated_at = utc_now()
     
-    db.commit()
-    db.refresh(db_policy_holder)
+    await db.commit()
     return db_policy_holder
 
 @router.delete("/{policy_holder_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_policy_holder(policy_holder_id: str, db: Session = Depends(get_db)):
+async def delete_policy_holder(policy_holder_id: str, db: AsyncSession = Depends(get_async_db)):
     """Delete a policy holder"""
-    policy_holder = db.query(PolicyHolder).filter(
-        PolicyHolder.policy_holder_id == policy_holder_id
-    ).first()
+    policy_holder = (await db.execute(
+        select(PolicyHolder).where(PolicyHolder.policy_holder_id == policy_holder_id)
+    )).scalar_one_or_none()
     
     if not policy_holder:
         raise HTTPException(status_code=404, detail="Policy holder not found")
     
-    db.delete(policy_holder)
-    db.commit()
+    await db.delete(policy_holder)
+    await db.commit()
     return None
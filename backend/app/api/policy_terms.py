@@ -2,25 +2,28 @@
 PolicyTerms API - Read-only access to policy terms and limits
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.schemas import PolicyTermsResponse
 from app.models import PolicyTerms
-from app.utils.database import get_db
+from app.utils.database import get_async_db
 
 router = APIRouter()
 
 @router.get("/", response_model=List[PolicyTermsResponse])
-async def list_policy_terms(db: Session = Depends(get_db)):
+async def list_policy_terms(db: AsyncSession = Depends(get_async_db)):
     """List all available policy terms"""
-    policies = db.query(PolicyTerms).all()
+    policies = (await db.execute(select(PolicyTerms))).scalars().all()
     return policies
 
 @router.get("/{policy_id}", response_model=PolicyTermsResponse)
-async def get_policy_terms(policy_id: str, db: Session = Depends(get_db)):
+async def get_policy_terms(policy_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get specific policy terms by ID"""
-    policy = db.query(PolicyTerms).filter(PolicyTerms.policy_id == policy_id).first()
+    policy = (await db.execute(
+        select(PolicyTerms).where(PolicyTerms.policy_id == policy_id)
+    )).scalar_one_or_none()
     
     if not policy:
         raise HTTPException(status_code=404, detail="Policy terms not found")
@@ -28,9 +31,11 @@ async def get_policy_terms(policy_id: str, db: Session = Depends(get_db)):
     return policy
 
 @router.get("/{policy_id}/limits", response_model=dict)
-async def get_policy_limits(policy_id: str, db: Session = Depends(get_db)):
+async def get_policy_limits(policy_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get all limits for a specific policy"""
-    policy = db.query(PolicyTerms).filter(PolicyTerms.policy_id == policy_id).first()
+    policy = (await db.execute(
+        select(PolicyTerms).where(PolicyTerms.policy_id == policy_id)
+    )).scalar_one_or_none()
     
     if not policy:
         raise HTTPException(status_code=404, detail="Policy terms not found")
@@ -54,9 +59,11 @@ async def get_policy_limits(policy_id: str, db: Session = Depends(get_db)):
     }
 
 @router.get("/{policy_id}/exclusions", response_model=dict)
-async def get_policy_exclusions(policy_id: str, db: Session = Depends(get_db)):
+async def get_policy_exclusions(policy_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get exclusions for a specific policy"""
-    policy = db.query(PolicyTerms).filter(PolicyTerms.policy_id == policy_id).first()
+    policy = (await db.execute(
+        select(PolicyTerms).where(PolicyTerms.policy_id == policy_id)
+    )).scalar_one_or_none()
     
     if not policy:
         raise HTTPException(status_code=404, detail="Policy terms not found")
@@ -3,14 +3,18 @@ Clean, RESTful upload endpoints with semantic URLs
 Pattern: /upload/{file_type}/{format}
 Examples: /upload/image/jpg, /upload/pdf, /upload/text
 """
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List, Literal
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Tuple
 from pydantic import BaseModel
+import asyncio
 import logging
 import uuid
 
-from app.utils.database import get_db
+from app.utils.database import get_async_db
+from app.utils.date_parser import utc_now
 from app.services.minio_service import get_storage_service
 from app.models.models import Document
 
@@ -22,6 +26,16 @@ logger = logging.getLogger(__name__)
 ImageFormat = Literal["jpg", "jpeg", "png", "heic"]
 DocumentFormat = Literal["pdf", "txt"]
 
+# Extension -> Content-Type, built once at import
+CONTENT_TYPE_MAP = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "heic": "image/heic",
+    "pdf": "application/pdf",
+    "txt": "text/plain"
+}
+
 class PresignedURLRequest(BaseModel):
     claim_id: str
     filename: str
@@ -40,7 +54,7 @@ class PresignedURLResponse(BaseModel):
 async def upload_image(
     format: ImageFormat,
     request: PresignedURLRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate presigned URL for image upload
@@ -51,21 +65,15 @@ async def upload_image(
     - POST /api/upload/image/png
     - POST /api/upload/image/heic
     """
-    content_type_map = {
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "png": "image/png",
-        "heic": "image/heic"
-    }
-    
-    return await _generate_presigned_url(
+    response, row = await _generate_presigned_url(
         claim_id=request.claim_id,
         filename=request.filename,
         document_type=request.document_type,
-        content_type=content_type_map[format],
-        file_extension=format,
-        db=db
+        content_type=CONTENT_TYPE_MAP[format],
+        file_extension=format
     )
+    await _insert_documents(db, [row])
+    return response
 
 
 # ============= PDF UPLOADS =============
@@ -73,21 +81,22 @@ async def upload_image(
 @router.post("/pdf", response_model=PresignedURLResponse)
 async def upload_pdf(
     request: PresignedURLRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate presigned URL for PDF upload
     
     Endpoint: POST /api/upload/pdf
     """
-    return await _generate_presigned_url(
+    response, row = await _generate_presigned_url(
         claim_id=request.claim_id,
         filename=request.filename,
         document_type=request.document_type,
         content_type="application/pdf",
-        file_extension="pdf",
-        db=db
+        file_extension="pdf"
     )
+    await _insert_documents(db, [row])
+    return response
 
 
 # ============= TEXT UPLOADS =============
@@ -95,21 +104,22 @@ async def upload_pdf(
 @router.post("/text", response_model=PresignedURLResponse)
 async def upload_text(
     request: PresignedURLRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate presigned URL for text file upload
     
     Endpoint: POST /api/upload/text
     """
-    return await _generate_presigned_url(
+    response, row = await _generate_presigned_url(
         claim_id=request.claim_id,
         filename=request.filename,
         document_type=request.document_type,
         content_type="text/plain",
-        file_extension="txt",
-        db=db
+        file_extension="txt"
     )
+    await _insert_documents(db, [row])
+    return response
 
 
 # ============= GENERIC UPLOAD (FALLBACK) =============
@@ -117,7 +127,7 @@ async def upload_text(
 @router.post("/other", response_model=PresignedURLResponse)
 async def upload_other(
     request: PresignedURLRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate presigned URL for other file types
@@ -127,25 +137,17 @@ async def upload_other(
     # Detect extension from filename
     file_extension = request.filename.split('.')[-1].lower()
     
-    content_type_map = {
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "png": "image/png",
-        "heic": "image/heic",
-        "pdf": "application/pdf",
-        "txt": "text/plain"
-    }
-    
-    content_type = content_type_map.get(file_extension, "application/octet-stream")
+    content_type = CONTENT_TYPE_MAP.get(file_extension, "application/octet-stream")
     
-    return await _generate_presigned_url(
+    response, row = await _generate_presigned_url(
         claim_id=request.claim_id,
         filename=request.filename,
         document_type=request.document_type,
         content_type=content_type,
-        file_extension=file_extension,
-        db=db
+        file_extension=file_extension
     )
+    await _insert_documents(db, [row])
+    return response
 
 
 # ============= BATCH UPLOAD =============
@@ -157,7 +159,7 @@ class BatchUploadRequest(BaseModel):
 @router.post("/batch", response_model=List[PresignedURLResponse])
 async def upload_batch(
     request: BatchUploadRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate presigned URLs for multiple files at once
@@ -173,35 +175,27 @@ async def upload_batch(
         ]
     }
     """
-    presigned_urls = []
-    
-    for file_req in request.files:
+    def _file_kwargs(file_req: PresignedURLRequest) -> dict:
         # Detect file type from extension
         file_extension = file_req.filename.split('.')[-1].lower()
-        
-        content_type_map = {
-            "jpg": "image/jpeg",
-            "jpeg": "image/jpeg",
-            "png": "image/png",
-            "heic": "image/heic",
-            "pdf": "application/pdf",
-            "txt": "text/plain"
-        }
-        
-        content_type = content_type_map.get(file_extension, "application/octet-stream")
-        
-        url_response = await _generate_presigned_url(
+        return dict(
             claim_id=request.claim_id,
             filename=file_req.filename,
             document_type=file_req.document_type,
-            content_type=content_type,
-            file_extension=file_extension,
-            db=db
+            content_type=CONTENT_TYPE_MAP.get(file_extension, "application/octet-stream"),
+            file_extension=file_extension
         )
-        
-        presigned_urls.append(url_response)
     
-    return presigned_urls
+    # Run all N helpers concurrently (each presigns in a worker thread)
+    # rather than awaiting each in turn; results keep request order
+    results = await asyncio.gather(
+        *(_generate_presigned_url(**_file_kwargs(file_req)) for file_req in request.files)
+    )
+    
+    # One multi-row INSERT and one commit for the whole batch
+    await _insert_documents(db, [row for _, row in results])
+    
+    return [response for response, _ in results]
 
 
 # ============= HELPER FUNCTION =============
@@ -211,11 +205,13 @@ async def _generate_presigned_url(
     filename: str,
     document_type: str,
     content_type: str,
-    file_extension: str,
-    db: Session
-) -> PresignedURLResponse:
+    file_extension: str
+) -> Tuple[PresignedURLResponse, dict]:
     """
-    Internal helper to generate presigned URL and create document record
+    Internal helper to generate presigned URL and the matching document row
+    
+    The row is returned rather than inserted so callers can write any
+    number of them with a single INSERT (see _insert_documents).
     """
     # Generate unique file ID
     file_id = str(uuid.uuid4())
@@ -224,19 +220,43 @@ async def _generate_presigned_url(
     # Format: claims/{claim_id}/{document_type}/{file_id}.{extension}
     object_name = f"claims/{claim_id}/{document_type}/{file_id}.{file_extension}"
     
-    # Generate presigned URL from MinIO
+    # Generate presigned URL from MinIO. The client call is synchronous
+    # (and may look up the bucket region over the network), so run it in a
+    # worker thread: that keeps the event loop free and lets upload_batch's
+    # gather overlap the calls
     minio_service = get_storage_service()
-    upload_url = minio_service.generate_presigned_upload_url(object_name)
+    upload_url = await asyncio.to_thread(minio_service.generate_presigned_upload_url, object_name)
     
-    # Note: Document record will be created after successful upload
-    # For now, just return the presigned URL
+    # Document row, so /complete can find it once the upload lands
+    row = {
+        "document_id": file_id,
+        "claim_id": claim_id,
+        "file_path": object_name,
+        "document_type": document_type,
+        "status": "uploaded",
+        "created_at": utc_now()
+    }
     
-    return PresignedURLResponse(
+    response = PresignedURLResponse(
         file_id=file_id,
         upload_url=upload_url,
         object_name=object_name,
         expires_in=3600  # 1 hour
     )
+    return response, row
+
+
+async def _insert_documents(db: AsyncSession, rows: List[dict]) -> None:
+    """Insert document rows as one executemany INSERT and commit once"""
+    if not rows:
+        return
+    try:
+        await db.execute(insert(Document), rows)
+        await db.commit()
+    except IntegrityError:
+        # documents.claim_id is a foreign key to claims
+        await db.rollback()
+        raise HTTPException(404, f"Claim {rows[0]['claim_id']} not found")
 
 
 # ============= UPLOAD COMPLETE CALLBACK =============
@@ -248,8 +268,7 @@ class UploadCompleteRequest(BaseModel):
 @router.post("/complete")
 async def upload_complete(
     request: UploadCompleteRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Mark file as uploaded and trigger OCR + Qdrant embedding
@@ -259,9 +278,9 @@ async def upload_complete(
     Called by frontend after successful PUT to MinIO
     """
     # Find document record
-    document = db.query(Document).filter(
-        Document.document_id == request.file_id
-    ).first()
+    document = (await db.execute(
+        select(Document).where(Document.document_id == request.file_id)
+    )).scalar_one_or_none()
     
     if not document:
         raise HTTPException(404, "Document not found")
@@ -271,14 +290,17 @@ async def upload_complete(
     download_url = minio_service.generate_presigned_download_url(request.object_name)
     document.file_url = download_url
     document.file_path = request.object_name
+    document.status = "processing"
     
-    db.commit()
+    await db.commit()
     
-    # Process document in background (async, non-blocking)
-    background_tasks.add_task(
-        process_document_background,
+    # Dispatch to Celery worker (non-blocking); OCR runs in the worker
+    # pool, not in this process's threadpool
+    from app.worker import process_document_task
+    process_document_task.delay(
         file_id=request.file_id,
-        object_name=request.object_name
+        file_path=request.object_name,
+        document_type=document.document_type or "other"
     )
     
     return {
@@ -286,54 +308,3 @@ async def upload_complete(
         "file_id": request.file_id,
         "message": "Document uploaded successfully. OCR and embedding in progress."
     }
-
-async def process_document_background(file_id: str, object_name: str):
-    """
-    Background task to process document
-    - Download from MinIO
-    - Extract text (OCR)
-    - Generate embedding
-    - Store in Qdrant
-    """
-    from app.utils.database import SessionLocal
-    from app.services.document_processor import DocumentProcessor
-    
-    db = SessionLocal()
-    try:
-        logger.info(f"[BACKGROUND] Processing document: {file_id}")
-        
-        # Get document
-        document = db.query(Document).filter(
-            Document.document_id == file_id
-        ).first()
-        
-        if not document:
-            logger.error(f"[BACKGROUND] Document not found: {file_id}")
-            return
-        
-        # Update status
-        document.status = "processing"
-        db.commit()
-        
-        # Process document
-        processor = DocumentProcessor()
-        result = await processor.process_document(
-            file_id=file_id,
-            object_name=object_name,
-            document_type=document.document_type
-        )
-        
-        # Update document with results
-        document.extracted_data = result.get("structured_data", {})
-        document.status = "processed"
-        db.commit()
-        
-        logger.info(f"[BACKGROUND] ✅ Processed: {file_id}")
-        
-    except Exception as e:
-        logger.error(f"[BACKGROUND] Error processing {file_id}: {str(e)}")
-        if document:
-            document.status = "failed"
-            db.commit()
-    finally:
-        db.close()
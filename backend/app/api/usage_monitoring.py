@@ -2,21 +2,33 @@
 API Usage Monitoring Endpoints
 Provides real-time usage statistics and cost tracking
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import BigInteger, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 
-from app.models.usage_log import APIUsageLog
-from app.utils.database import get_db
-from app.services.redis_rate_limiter import RedisRateLimiter
+from app.config import settings
+from app.models.usage_log import APIUsageLog, APIUsageHourly
+from app.services.usage_rollup import UNKNOWN_DOCUMENT_TYPE, hour_start, status_aggregates
+from app.utils.cache import redis_cached
+from app.utils.database import get_async_db
+from app.services.redis_rate_limiter import get_rate_limiter, USAGE_STATS_CACHE_KEY
 
 router = APIRouter()
 
+# Limits are process constants: read once, with percentage factors precomputed
+_RPM = settings.OPENAI_RPM_LIMIT
+_TPM = settings.OPENAI_TPM_LIMIT
+_RPD = settings.OPENAI_RPD_LIMIT
+_RPM_PCT = 100.0 / _RPM
+_TPM_PCT = 100.0 / _TPM
+_RPD_PCT = 100.0 / _RPD
+
 
 @router.get("/usage/stats")
-async def get_usage_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
+@redis_cached(lambda **_: USAGE_STATS_CACHE_KEY, ttl=5)
+async def get_usage_stats(db: AsyncSession = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Get current API usage statistics
     
@@ -27,40 +39,57 @@ async def get_usage_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
             "limits": {...}
         }
     """
-    rate_limiter = RateLimiter()
-    stats = rate_limiter.get_usage_stats(db)
+    # Live counters come from Redis (shared limiter, no reconnect per call);
+    # spend is only in the audit log, over the same rolling 24h window as RPD
+    stats = get_rate_limiter().get_usage_stats()
+    day_cost = (await db.execute(
+        select(func.coalesce(func.sum(APIUsageLog.cost_usd), 0.0)).where(
+            APIUsageLog.timestamp >= datetime.now(timezone.utc) - timedelta(days=1),
+            APIUsageLog.status == "success"
+        )
+    )).scalar()
+    
+    minute_requests = stats["minute"]["requests"]
+    minute_tokens = stats["minute"]["tokens"]
+    day_requests = stats["day"]["requests"]
     
     return {
         "current_minute": {
-            "requests": stats["minute"]["requests"],
-            "tokens": stats["minute"]["tokens"],
-            "rpm_limit": stats["minute"]["rpm_limit"],
-            "tpm_limit": stats["minute"]["tpm_limit"],
-            "rpm_percentage": round((stats["minute"]["requests"] / stats["minute"]["rpm_limit"]) * 100, 1),
-            "tpm_percentage": round((stats["minute"]["tokens"] / stats["minute"]["tpm_limit"]) * 100, 1)
+            "requests": minute_requests,
+            "tokens": minute_tokens,
+            "rpm_limit": _RPM,
+            "tpm_limit": _TPM,
+            "rpm_percentage": round(minute_requests * _RPM_PCT, 1),
+            "tpm_percentage": round(minute_tokens * _TPM_PCT, 1)
         },
         "current_day": {
-            "requests": stats["day"]["requests"],
-            "cost_usd": round(stats["day"]["cost_usd"], 4),
-            "rpd_limit": stats["day"]["rpd_limit"],
-            "rpd_percentage": round((stats["day"]["requests"] / stats["day"]["rpd_limit"]) * 100, 1)
+            "requests": day_requests,
+            "cost_usd": round(day_cost, 4),
+            "rpd_limit": _RPD,
+            "rpd_percentage": round(day_requests * _RPD_PCT, 1)
         },
         "limits": {
-            "rpm": stats["minute"]["rpm_limit"],
-            "tpm": stats["minute"]["tpm_limit"],
-            "rpd": stats["day"]["rpd_limit"]
+            "rpm": _RPM,
+            "tpm": _TPM,
+            "rpd": _RPD
         }
     }
 
 
 @router.get("/usage/history")
 async def get_usage_history(
+    request: Request,
+    response: Response,
     hours: int = 24,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get usage history for the last N hours
     
+    Conditional: the ETag fingerprints the window and the log rows in its
+    live part (rolled-up hours do not change), so a polling dashboard that
+    sends If-None-Match gets a bodyless 304 until a new call is logged.
+    
     Args:
         hours: Number of hours to look back (default: 24)
         
@@ -69,58 +98,116 @@ async def get_usage_history(
             "total_requests": X,
             "total_tokens": Y,
             "total_cost_usd": Z,
+            "rate_limited_requests": R,
+            "failed_requests": F,
             "by_document_type": {...},
             "by_hour": [...]
         }
     """
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+    now = datetime.now(timezone.utc)
+    cutoff_time = now - timedelta(hours=hours)
+    
+    # Whole hours before the previous one come from the api_usage_hourly
+    # rollup (one row per hour and type). The rollup job refreshes every
+    # few minutes, so the last hour or two are aggregated live from the log.
+    live_from = max(cutoff_time, hour_start(now) - timedelta(hours=1))
+    
+    # Index-only probe of the live window (partition-pruned); the count
+    # also catches rows whose lower ids committed late
+    latest_id, live_rows = (await db.execute(
+        select(func.max(APIUsageLog.id), func.count()).where(APIUsageLog.timestamp >= live_from)
+    )).one()
+    version = f"{hours}-{int(live_from.timestamp())}-{latest_id or 0}-{live_rows}"
+    etag = f'W/"{version}"'
     
-    # Total stats
-    total_requests = db.query(func.count(APIUsageLog.id)).filter(
-        APIUsageLog.timestamp >= cutoff_time,
-        APIUsageLog.status == "success"
-    ).scalar() or 0
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     
-    total_tokens = db.query(func.sum(APIUsageLog.total_tokens)).filter(
-        APIUsageLog.timestamp >= cutoff_time,
-        APIUsageLog.status == "success"
-    ).scalar() or 0
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "max-age=5"
+    return await _usage_history(
+        hours=hours, cutoff_time=cutoff_time, live_from=live_from, version=version, db=db
+    )
+
+
+# Keyed on the ETag version, so a cached body always matches its ETag
+@redis_cached(lambda version, **_: f"usage:history:v2:{version}", ttl=30)
+async def _usage_history(
+    hours: int,
+    cutoff_time: datetime,
+    live_from: datetime,
+    version: str,
+    db: AsyncSession
+) -> Dict[str, Any]:
+    """Aggregate usage history over [cutoff_time, now): rollup, then live log"""
+    rolled_up = (await db.execute(
+        select(
+            APIUsageHourly.document_type,
+            func.sum(APIUsageHourly.requests).label('requests'),
+            # SUM(bigint) is numeric in Postgres (Decimal via asyncpg); cast
+            # back so totals stay ints and the body stays orjson-serialisable
+            cast(func.sum(APIUsageHourly.tokens), BigInteger).label('tokens'),
+            func.sum(APIUsageHourly.cost_usd).label('cost_usd'),
+            func.sum(APIUsageHourly.rate_limited).label('rate_limited'),
+            func.sum(APIUsageHourly.failed).label('failed')
+        ).where(
+            APIUsageHourly.hour >= hour_start(cutoff_time),
+            APIUsageHourly.hour < live_from
+        ).group_by(APIUsageHourly.document_type)
+    )).all()
     
-    total_cost = db.query(func.sum(APIUsageLog.cost_usd)).filter(
-        APIUsageLog.timestamp >= cutoff_time,
-        APIUsageLog.status == "success"
-    ).scalar() or 0.0
+    # Every outcome bucket in one pass over the live window (FILTER clauses)
+    live_document_type = func.coalesce(APIUsageLog.document_type, UNKNOWN_DOCUMENT_TYPE)
+    live = (await db.execute(
+        select(
+            live_document_type.label('document_type'),
+            *status_aggregates()
+        ).where(
+            APIUsageLog.timestamp >= live_from
+        ).group_by(live_document_type)
+    )).all()
     
-    # By document type
-    by_type = db.query(
-        APIUsageLog.document_type,
-        func.count(APIUsageLog.id).label('count'),
-        func.sum(APIUsageLog.cost_usd).label('cost')
-    ).filter(
-        APIUsageLog.timestamp >= cutoff_time,
-        APIUsageLog.status == "success"
-    ).group_by(APIUsageLog.document_type).all()
+    # document_type has a handful of values; merge and total in Python
+    fields = ("requests", "tokens", "cost_usd", "rate_limited", "failed")
+    by_type = {}
+    for row in (*rolled_up, *live):
+        bucket = by_type.setdefault(row.document_type, dict.fromkeys(fields, 0))
+        for field in fields:
+            bucket[field] += getattr(row, field)
+    
+    totals = {
+        field: sum(bucket[field] for bucket in by_type.values())
+        for field in fields
+    }
+    total_requests = totals["requests"]
+    total_tokens = totals["tokens"]
+    total_cost = totals["cost_usd"]
     
     return {
         "period_hours": hours,
         "total_requests": total_requests,
         "total_tokens": total_tokens,
-        "total_cost_usd": round(float(total_cost), 4),
+        "total_cost_usd": round(total_cost, 4),
         "average_tokens_per_request": round(total_tokens / total_requests, 1) if total_requests > 0 else 0,
+        "rate_limited_requests": totals["rate_limited"],
+        "failed_requests": totals["failed"],
         "by_document_type": {
-            row.document_type: {
-                "count": row.count,
-                "cost_usd": round(float(row.cost), 4)
+            document_type: {
+                "count": bucket["requests"],
+                "cost_usd": round(bucket["cost_usd"], 4),
+                "rate_limited": bucket["rate_limited"],
+                "failed": bucket["failed"]
             }
-            for row in by_type
+            for document_type, bucket in by_type.items()
         }
     }
 
 
 @router.get("/usage/recent")
+@redis_cached(lambda limit, **_: f"usage:recent:v1:{limit}", ttl=5)
 async def get_recent_usage(
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get most recent API calls
@@ -131,14 +218,25 @@ async def get_recent_usage(
     Returns:
         List of recent API calls with details
     """
-    recent_logs = db.query(APIUsageLog).order_by(
-        APIUsageLog.timestamp.desc()
-    ).limit(limit).all()
+    # Only the serialised columns, all in ix_api_usage_logs_ts_covering:
+    # a backward index-only scan, and plain rows instead of ORM objects
+    recent_logs = (await db.execute(
+        select(
+            APIUsageLog.timestamp,
+            APIUsageLog.document_id,
+            APIUsageLog.document_type,
+            APIUsageLog.model,
+            APIUsageLog.total_tokens,
+            APIUsageLog.cost_usd,
+            APIUsageLog.status,
+            APIUsageLog.response_time_ms
+        ).order_by(APIUsageLog.timestamp.desc()).limit(limit)
+    )).all()
     
     return {
         "recent_calls": [
             {
-                "timestamp": log.timestamp.isoformat(),
+                "timestamp": log.timestamp,  # serialised natively by orjson
                 "document_id": log.document_id,
                 "document_type": log.document_type,
                 "model": log.model,
@@ -1,9 +1,16 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import os
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
+
+# Load environment variables from the nearest .env (backend/ or repo root),
+# before the routers import and read their settings.
+# In Docker: environment variables are passed directly by docker-compose and
+# take precedence (override=False).
+load_dotenv(find_dotenv(usecwd=True), override=False)
 
 from app.api import (
     claims,
@@ -22,14 +29,6 @@ from app.api import (
 )
 from app.utils.database import engine, Base
 
-# Load environment variables from root .env file
-# In Docker: environment variables are passed directly by docker-compose
-# In local dev: load from parent directory (root) .env file
-load_dotenv()  # Try current directory first
-if not os.getenv("DATABASE_URL"):
-    # If not found, try parent directory (root .env)
-    load_dotenv(os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
-
 # NOTE: Database tables are managed via Alembic migrations
 # Run `alembic upgrade head` to create/update database schema
 # Do NOT use Base.metadata.create_all() in production as it conflicts with migration tracking
@@ -54,7 +53,8 @@ app = FastAPI(
     title="OPD Claims Adjudication API",
     description="AI-powered system for automating OPD Insureho claim decisions",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -63,8 +63,11 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists: Starlette builds the preflight response headers once
+    # at startup instead of echoing/matching wildcards per request
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With", "Last-Event-ID"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
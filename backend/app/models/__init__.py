@@ -1,6 +1,6 @@
 # This file makes the models directory a Python package
+from app.models.enums import DecisionType, PolicyStatus, TreatmentType
 from app.models.models import (
-    Claim, Document, PolicyHolder, ManualReview, Dependent, PolicyTerms,
-    DecisionType, PolicyStatus, TreatmentType
+    Claim, Document, PolicyHolder, ManualReview, Dependent, PolicyTerms
 )
-from app.models.usage_log import APIUsageLog
+from app.models.usage_log import APIUsageLog, APIUsageHourly
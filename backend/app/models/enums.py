@@ -1,5 +1,9 @@
 """
 Enums for the application
+
+Single definition of every enum; models and schemas import from here.
+Enum columns (SQLEnum) store member names, so values only matter in API
+payloads.
 """
 import enum
 
@@ -32,13 +36,27 @@ class ClaimStatus(str, enum.Enum):
 
 class DecisionType(str, enum.Enum):
     """Claim decision type"""
-    APPROVED = "approved"
-    REJECTED = "rejected"
-    PARTIAL = "partial"
-    MANUAL_REVIEW = "manual_review"
+    APPROVED = "APPROVED"
+    REJECTED = "REJECTED"
+    PARTIAL = "PARTIAL"
+    MANUAL_REVIEW = "MANUAL_REVIEW"
+
+class PolicyStatus(str, enum.Enum):
+    """Policy holder status"""
+    ACTIVE = "ACTIVE"
+    INACTIVE = "INACTIVE"
+    SUSPENDED = "SUSPENDED"
+
+class TreatmentType(str, enum.Enum):
+    """OPD treatment category"""
+    CONSULTATION = "consultation"
+    DIAGNOSTIC = "diagnostic"
+    PHARMACY = "pharmacy"
+    DENTAL = "dental"
+    VISION = "vision"
+    ALTERNATIVE_MEDICINE = "alternative_medicine"
 
 class UserRole(str, enum.Enum):
     """User role enumeration"""
     USER = "user"  # Claimant/Provider
     ADMIN = "admin"  # Insurer/Adjudicator
-    SUPER_ADMIN = "super_admin"
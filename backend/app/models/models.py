@@ -1,29 +1,10 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey, Enum as SQLEnum, Boolean, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey, Enum as SQLEnum, Boolean, Text, Index, cast, func
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
-import enum
+from app.models.enums import DecisionType, PolicyStatus
 from app.utils.database import Base
 
-# Enums
-class DecisionType(str, enum.Enum):
-    APPROVED = "APPROVED"
-    REJECTED = "REJECTED"
-    PARTIAL = "PARTIAL"
-    MANUAL_REVIEW = "MANUAL_REVIEW"
-
-class PolicyStatus(str, enum.Enum):
-    ACTIVE = "ACTIVE"
-    INACTIVE = "INACTIVE"
-    SUSPENDED = "SUSPENDED"
-
-class TreatmentType(str, enum.Enum):
-    CONSULTATION = "consultation"
-    DIAGNOSTIC = "diagnostic"
-    PHARMACY = "pharmacy"
-    DENTAL = "dental"
-    VISION = "vision"
-    ALTERNATIVE_MEDICINE = "alternative_medicine"
-
 # Policy Terms Model
 class PolicyTerms(Base):
     __tablename__ = "policy_terms"
@@ -75,7 +56,7 @@ class Dependent(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     dependent_id = Column(String, unique=True, index=True)
-    policy_holder_id = Column(String, ForeignKey("policy_holders.policy_holder_id"))
+    policy_holder_id = Column(String, ForeignKey("policy_holders.policy_holder_id"), index=True)
     dependent_name = Column(String)
     relationship_type = Column(String)  # spouse, child, parent
     date_of_birth = Column(DateTime)
@@ -121,6 +102,16 @@ class PolicyHolder(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    @hybrid_property
+    def policy_status_str(self) -> str:
+        """Policy status as a plain string (enum value, or raw DB value)"""
+        status = self.policy_status
+        return status.value if isinstance(status, PolicyStatus) else str(status)
+    
+    @policy_status_str.expression
+    def policy_status_str(cls):
+        return cast(cls.policy_status, String)
+    
     # Relationships
     claims = relationship("Claim", back_populates="policy_holder")
     dependents = relationship("Dependent", back_populates="policy_holder")
@@ -149,7 +140,12 @@ class Claim(Base):
     doctor_registration_number = Column(String, nullable=True)
     
     # Financial details
-    submission_date = Column(DateTime, default=datetime.utcnow)
+    submission_date = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.timezone("utc", func.now())  # raw-SQL / seed inserts
+    )
     claimed_amount = Column(Float)  # Original claimed amount
     eligible_amount = Column(Float, nullable=True)  # After coverage check
     co_payment_amount = Column(Float, default=0.0)
@@ -183,6 +179,23 @@ class Claim(Base):
     # Relationships
     documents = relationship("Document", back_populates="claim")
     policy_holder = relationship("PolicyHolder", back_populates="claims")
+    
+    __table_args__ = (
+        # Newest-first keyset pagination in list_claims
+        Index(
+            "ix_claims_submission_date_claim_id",
+            submission_date.desc(),
+            claim_id.desc()
+        ),
+        # Decided claims only; backs the confidence buckets in /metrics/accuracy
+        Index(
+            "ix_claims_decided_confidence",
+            "confidence_score",
+            postgresql_where=decision.isnot(None)
+        ),
+        # Per-day grouping in /metrics/trends
+        Index("ix_claims_created_date", func.date(created_at)),
+    )
 
 # Document Model (Enhanced)
 class Document(Base):
@@ -190,7 +203,7 @@ class Document(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     document_id = Column(String, unique=True, index=True)
-    claim_id = Column(String, ForeignKey("claims.claim_id"))
+    claim_id = Column(String, ForeignKey("claims.claim_id"), index=True)
     document_type = Column(String)  # prescription, bill, test_report
     file_path = Column(String)
     file_url = Column(String, nullable=True)
@@ -225,6 +238,15 @@ class ManualReview(Base):
     reason_for_review = Column(String, nullable=True)  # fraud_suspected, high_value, low_confidence
     created_at = Column(DateTime, default=datetime.utcnow)
     reviewed_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        # Pending queue only; serves keyset pagination on id
+        Index(
+            "ix_manual_reviews_pending",
+            "id",
+            postgresql_where=review_status == "PENDING"
+        ),
+    )
 
 
 # Claim Decision Model - Detailed Adjudication Results
@@ -264,4 +286,12 @@ class ClaimDecision(Base):
     reviewed_by = Column(String, nullable=True)  # For manual review override
     reviewed_at = Column(DateTime, nullable=True)
     review_notes = Column(Text, nullable=True)
-
+    
+    __table_args__ = (
+        # Small, hot index over unreviewed decisions only (pending-review queue)
+        Index(
+            "ix_claim_decisions_pending_review",
+            "decision",
+            postgresql_where=reviewed_by.is_(None)
+        ),
+    )
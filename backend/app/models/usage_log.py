@@ -2,7 +2,8 @@
 API Usage Logging Model
 Tracks every OpenAI API call for auditing and cost monitoring
 """
-from sqlalchemy import Column, Integer, String, DateTime, Float
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Float, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.utils.database import Base
 
@@ -17,11 +18,13 @@ class APIUsageLog(Base):
     """
     __tablename__ = "api_usage_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # Range-partitioned by month on timestamp, so the partition key is part
+    # of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    timestamp = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     
     # Request metadata
-    endpoint = Column(String, index=True)  # e.g., "document_processing"
+    endpoint = Column(String)  # e.g., "document_processing"
     document_id = Column(String, index=True)  # e.g., "DOC4A2B3C4D5E"
     document_type = Column(String)  # prescription, bill, report
     
@@ -40,3 +43,55 @@ class APIUsageLog(Base):
     
     # Performance metrics
     response_time_ms = Column(Integer, nullable=True)  # API response time
+
+    # document_id is a plain string (no FK: logs outlive deleted documents),
+    # so the join is declared here. Read-only; load it with selectinload
+    # (see app.utils.query), never lazily.
+    document = relationship(
+        "Document",
+        primaryjoin="foreign(APIUsageLog.document_id) == Document.document_id",
+        viewonly=True
+    )
+
+    __table_args__ = (
+        # Serves "WHERE endpoint = ? ORDER BY timestamp DESC" analytics queries
+        Index("ix_api_usage_logs_endpoint_ts", endpoint, timestamp.desc()),
+        # Rate-limit windows and usage aggregates: status = 'success' AND
+        # timestamp >= cutoff as one range scan
+        Index("ix_api_usage_logs_status_ts", status, timestamp),
+        # Per-document_type breakdowns over a time window
+        Index("ix_api_usage_logs_doctype_ts", document_type, timestamp),
+        # Newest-first listing (/usage/recent) answered index-only; also
+        # serves bare timestamp range lookups
+        Index(
+            "ix_api_usage_logs_ts_covering",
+            timestamp.desc(),
+            postgresql_include=[
+                "document_id", "document_type", "model", "total_tokens",
+                "cost_usd", "status", "response_time_ms"
+            ]
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
+
+class APIUsageHourly(Base):
+    """
+    Hourly rollup of API calls per document type
+
+    requests/tokens/cost_usd cover successful calls only; rate_limited and
+    failed count the other outcomes.
+
+    Maintained by the rollup_usage_hourly_task beat job from APIUsageLog, so
+    usage history sums a row per hour instead of re-scanning the log.
+    """
+    __tablename__ = "api_usage_hourly"
+
+    hour = Column(DateTime(timezone=True), primary_key=True)  # Hour start (UTC)
+    document_type = Column(String, primary_key=True)  # "unknown" when unset on the log row
+
+    requests = Column(Integer, nullable=False, default=0)
+    tokens = Column(BigInteger, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+    rate_limited = Column(Integer, nullable=False, default=0, server_default="0")
+    failed = Column(Integer, nullable=False, default=0, server_default="0")  # "failed" or "error"
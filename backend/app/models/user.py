@@ -4,14 +4,10 @@ User model for authentication
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
 from sqlalchemy.sql import func
 from datetime import datetime
-import enum
 
+from app.models.enums import UserRole
 from app.utils.database import Base
 
-class UserRole(str, enum.Enum):
-    USER = "user"  # Claimant/Provider
-    ADMIN = "admin"  # Insurer/Adjudicator
-
 class User(Base):
     __tablename__ = "users"
     
@@ -23,3 +19,7 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Fetch server-generated timestamps via RETURNING on INSERT/UPDATE
+    # rather than a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
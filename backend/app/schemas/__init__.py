@@ -1,11 +1,12 @@
 # This file makes the schemas directory a Python package
 from app.schemas.schemas import (
-    ClaimCreate, ClaimResponse, AdjudicationResult,
+    ClaimCreate, ClaimResponse, ClaimListItem, AdjudicationResult,
     DocumentUpload, DocumentResponse,
     PolicyHolderCreate, PolicyHolderResponse,
     PolicyTermsResponse,
     DependentCreate, DependentResponse,
-    PrescriptionData, BillData,
+    PrescriptionData, BillData, Medicine, BillItem,
     ManualReviewCreate, ManualReviewUpdate, ManualReviewResponse,
-    DecisionType, DocumentType, TreatmentType
+    DecisionType, DocumentType
 )
+from app.models.enums import TreatmentType
@@ -1,28 +1,21 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from app.models.enums import DecisionType
+
 # Enums
-class DecisionType(str, Enum):
-    APPROVED = "APPROVED"
-    REJECTED = "REJECTED"
-    PARTIAL = "PARTIAL"
-    MANUAL_REVIEW = "MANUAL_REVIEW"
+# Decision as it leaves the API: a Literal validates by value lookup, so
+# response models skip Enum construction (ORM code keeps DecisionType)
+DecisionLiteral = Literal["APPROVED", "REJECTED", "PARTIAL", "MANUAL_REVIEW"]
 
+# Upload-facing document types (narrower than the stored DocumentType)
 class DocumentType(str, Enum):
     PRESCRIPTION = "prescription"
     BILL = "bill"
     TEST_REPORT = "test_report"
 
-class TreatmentType(str, Enum):
-    CONSULTATION = "consultation"
-    DIAGNOSTIC = "diagnostic"
-    PHARMACY = "pharmacy"
-    DENTAL = "dental"
-    VISION = "vision"
-    ALTERNATIVE_MEDICINE = "alternative_medicine"
-
 # PolicyTerms Schemas
 class PolicyTermsResponse(BaseModel):
     id: int
@@ -40,8 +33,7 @@ class PolicyTermsResponse(BaseModel):
     exclusions: List[str]
     network_providers: List[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Dependent Schemas
 class DependentCreate(BaseModel):
@@ -59,8 +51,7 @@ class DependentResponse(BaseModel):
     date_of_birth: datetime
     gender: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # PolicyHolder Schemas (Enhanced)
 class PolicyHolderCreate(BaseModel):
@@ -92,8 +83,7 @@ class PolicyHolderResponse(BaseModel):
     annual_limit_used: float
     pre_existing_conditions: List[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Claim Schemas (Enhanced)
 class ClaimCreate(BaseModel):
@@ -122,7 +112,7 @@ class ClaimResponse(BaseModel):
     eligible_amount: Optional[float]
     co_payment_amount: float
     approved_amount: float
-    deductions: Dict[str, Any]
+    deductions: Dict[str, float]
     
     # Provider
     provider_name: Optional[str]
@@ -132,7 +122,7 @@ class ClaimResponse(BaseModel):
     
     # Status
     status: str
-    decision: Optional[DecisionType]
+    decision: Optional[DecisionLiteral]
     processed_at: Optional[datetime]
     
     # Decision details
@@ -147,12 +137,25 @@ class ClaimResponse(BaseModel):
     
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+class ClaimListItem(BaseModel):
+    """Summary row for claim listings (no decision/validation detail)"""
+    claim_id: str
+    policy_holder_id: str
+    policy_holder_name: str
+    treatment_type: Optional[str]
+    claimed_amount: float
+    approved_amount: float
+    status: str
+    decision: Optional[DecisionLiteral]
+    submission_date: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
 
 class AdjudicationResult(BaseModel):
     claim_id: str
-    decision: DecisionType
+    decision: DecisionLiteral
     approved_amount: float
     rejection_reasons: List[str]
     confidence_score: float
@@ -181,17 +184,25 @@ class DocumentResponse(BaseModel):
     validation_errors: List[str]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Extracted Data Schemas
+class Medicine(BaseModel):
+    name: Optional[str] = None
+    dosage: Optional[str] = None
+    duration: Optional[str] = None
+
+class BillItem(BaseModel):
+    description: Optional[str] = None
+    amount: Optional[float] = None
+
 class PrescriptionData(BaseModel):
     doctor_name: Optional[str] = None
     doctor_registration: Optional[str] = None
     patient_name: Optional[str] = None
     patient_age: Optional[str] = None
     diagnosis: Optional[str] = None
-    medicines: List[Dict[str, str]] = []
+    medicines: List[Medicine] = []
     tests_advised: List[str] = []
     date: Optional[str] = None
 
@@ -204,7 +215,7 @@ class BillData(BaseModel):
     diagnostic_tests: Optional[float] = None
     medicines: Optional[float] = None
     total_amount: Optional[float] = None
-    items: List[Dict[str, Any]] = []
+    items: List[BillItem] = []
 
 # Manual Review Schemas
 class ManualReviewCreate(BaseModel):
@@ -230,15 +241,14 @@ class ManualReviewResponse(BaseModel):
     created_at: datetime
     reviewed_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Claim Decision Schemas
 class ClaimDecisionResponse(BaseModel):
     """Response schema for claim adjudication decision"""
     claim_id: str
-    decision: DecisionType
+    decision: DecisionLiteral
     approved_amount: float
     original_amount: float
     rejection_reasons: List[str] = []
@@ -262,8 +272,7 @@ class ClaimDecisionResponse(BaseModel):
     adjudicated_at: datetime
     adjudicated_by: str = "SYSTEM"
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AdjudicationRequest(BaseModel):
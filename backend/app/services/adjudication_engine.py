@@ -2,11 +2,11 @@
 Claims Adjudication Engine
 Automated decision-making for OPD insurance claims
 """
-import json
 import logging
-from typing import Dict, Any, List, Tuple, Optional
+import orjson
+from functools import lru_cache
+from typing import Dict, Any, List, Literal, Tuple, Optional
 from datetime import datetime, timedelta
-from pathlib import Path
 from pydantic import BaseModel, Field
 
 from app.models.models import ClaimDecision, DecisionType, PolicyHolder, Claim
@@ -26,10 +26,17 @@ client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 logger = logging.getLogger(__name__)
 
 
+def _to_json(value: Any) -> str:
+    """Serialize prompt context compactly with orjson (the LLM needs no indentation)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Pydantic Schema for Structured LLM Output (Guaranteed Parsing)
+# Passed to the API as the response format: decoding is constrained to the
+# schema server-side, so final_decision is always a DecisionType value
 class LLMAdjudicationResponse(BaseModel):
     """Structured output schema for LLM adjudication - prevents parsing errors"""
-    final_decision: str = Field(
+    final_decision: Literal["APPROVED", "REJECTED", "PARTIAL", "MANUAL_REVIEW"] = Field(
         ..., 
         description="Must be one of: APPROVED, REJECTED, PARTIAL, MANUAL_REVIEW"
     )
@@ -46,11 +53,22 @@ class LLMAdjudicationResponse(BaseModel):
         description="Instructions for the claimant"
     )
     confidence_score: Optional[float] = Field(
-        default=0.95,
+        default=None,
         description="Confidence in decision (0.0-1.0)"
     )
 
 
+# Checklist per validation stage (static; adjudication_rules.md is the prose
+# version and is not parsed yet)
+ADJUDICATION_RULES = {
+    "eligibility_checks": ["policy_status", "waiting_period", "member_verification"],
+    "document_checks": ["legibility", "completeness", "authenticity", "date_consistency"],
+    "coverage_checks": ["service_covered", "not_excluded", "pre_auth"],
+    "limit_checks": ["annual_limit", "sub_limit", "per_claim_limit"],
+    "medical_checks": ["diagnosis_treatment_alignment", "medical_necessity"]
+}
+
+
 class AdjudicationEngine:
     """
     Core engine for automated claims adjudication
@@ -60,7 +78,9 @@ class AdjudicationEngine:
     def __init__(self):
         """Initialize engine with policy terms and rules"""
         self.policy_terms = self._load_policy_terms()
-        self.adjudication_rules = self._load_adjudication_rules()
+        # Serialized once: the same terms go into every enrichment prompt
+        self._policy_terms_json = _to_json(self.policy_terms)
+        self.adjudication_rules = ADJUDICATION_RULES
         
         # Initialize Validators
         self.eligibility_validator = EligibilityValidator()
@@ -124,27 +144,6 @@ class AdjudicationEngine:
             logger.error(f"❌ Failed to load policy terms: {e}")
             return {}
     
-    def _load_adjudication_rules(self) -> Dict:
-        """Load adjudication rules from markdown file"""
-        try:
-            # Use backend directory path
-            rules_file = Path(__file__).parent.parent.parent / "adjudication_rules.md"
-            
-            # For now, return a structured dict
-            # TODO: Parse adjudication_rules.md for more detailed rules
-            rules = {
-                "eligibility_checks": ["policy_status", "waiting_period", "member_verification"],
-                "document_checks": ["legibility", "completeness", "authenticity", "date_consistency"],
-                "coverage_checks": ["service_covered", "not_excluded", "pre_auth"],
-                "limit_checks": ["annual_limit", "sub_limit", "per_claim_limit"],
-                "medical_checks": ["diagnosis_treatment_alignment", "medical_necessity"]
-            }
-            
-            return rules
-        except Exception as e:
-            logger.error(f"❌ Failed to load adjudication rules: {e}")
-            return {}
-    
     async def adjudicate_claim(
         self,
         claim_id: str,
@@ -173,7 +172,8 @@ class AdjudicationEngine:
         )
         
         # Run Validators (Hard Rules)
-        # We run ALL validators to gather full context for the LLM
+        # We run ALL validators: they are cheap, and every decision carries
+        # the full set of reasons and the same confidence calculation
         eligibility = self.eligibility_validator.validate(policy_context, claim_evidence, policy_terms)
         documents = self.document_validator.validate(claim_evidence)
         coverage = self.coverage_validator.validate(claim_evidence, policy_terms)
@@ -210,6 +210,7 @@ class AdjudicationEngine:
         elif fraud.get("suspicious", False):
             decision.decision = DecisionType.MANUAL_REVIEW
             decision.rejection_reasons = ["Fraud Suspected"]
+            decision.approved_amount = 0.0
             # Lower confidence for fraud cases
             decision.confidence_score = max(0.5, confidence - 0.2)
         else:
@@ -219,6 +220,12 @@ class AdjudicationEngine:
              decision.copay_amount = limits.get("copay_amount", 0)
              decision.copay_percentage = limits.get("copay_percentage", 0)
 
+        # 🛡️ Eligibility is a hard guardrail the LLM may not override: an
+        # ineligible claim is rejected here, without the LLM call
+        if not eligibility["passed"] and adjudication_context.get("skip_llm_on_killswitch", True):
+            logger.info(f"🛑 Kill switch for claim {claim_id}: eligibility failed")
+            return self._create_rejection(decision, errors)
+
         # 🚀 LLM Enrichment Step (The "Judge")
         # We pass the preliminary status + full context to the LLM for the final narrative
         try:
@@ -251,8 +258,6 @@ class AdjudicationEngine:
         """
         Uses GPT-4o to generate reasoning, citations, and polished output
         """
-        import json
-        
         system_prompt = (
             "You are an Expert Insurance Claims Adjudicator. "
             "Your job is to review the claim data, the policy terms, and the automated validation results.\n\n"
@@ -268,53 +273,44 @@ class AdjudicationEngine:
             "4. Reference specific numbers from the Policy Terms in your citations."
         )
         
+        policy_terms = context.get('policy_terms')
+        if policy_terms is self.policy_terms:
+            policy_terms_json = self._policy_terms_json
+        else:
+            policy_terms_json = _to_json(policy_terms)
+        
         user_prompt = (
-            f"Policy Terms:\n{json.dumps(context.get('policy_terms'), indent=2)}\n\n"
-            f"Claim Data:\n{json.dumps(context.get('claim_evidence'), indent=2)}\n\n"
-            f"Automated Validation Results:\n{json.dumps(validation_results, indent=2)}\n\n"
+            f"Policy Terms:\n{policy_terms_json}\n\n"
+            f"Claim Data:\n{_to_json(context.get('claim_evidence'))}\n\n"
+            f"Automated Validation Results:\n{_to_json(validation_results)}\n\n"
             f"Current Preliminary Decision: {decision.decision.value}\n"
-            f"Current Errors: {json.dumps(decision.rejection_reasons)}"
+            f"Current Errors: {_to_json(decision.rejection_reasons)}"
         )
         
-        response = await client.chat.completions.create(
+        response = await client.chat.completions.parse(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            response_format={ "type": "json_object" },
+            response_format=LLMAdjudicationResponse,
             temperature=0.1
         )
         
-        llm_content = response.choices[0].message.content
-        result = json.loads(llm_content)
-        
-        # Update Decision Object
-        valid_decisions = ["APPROVED", "REJECTED", "PARTIAL", "MANUAL_REVIEW"]
-        if result.get("final_decision") in valid_decisions:
-             # Map string to Enum if needed, or just use value
-             # Assuming DecisionType matches uppercase strings
-             # decision.decision = DecisionType[result["final_decision"]] # Might be risky if enum names differ
-             
-             # Safe mapping
-             decision_map = {
-                 "APPROVED": DecisionType.APPROVED,
-                 "REJECTED": DecisionType.REJECTED,
-                 "PARTIAL": DecisionType.PARTIAL,
-                 "MANUAL_REVIEW": DecisionType.MANUAL_REVIEW
-             }
-             if result["final_decision"] in decision_map:
-                 decision.decision = decision_map[result["final_decision"]]
-        
-        decision.notes = result.get("reasoning", decision.notes)
-        decision.next_steps = result.get("next_steps", decision.next_steps)
-        
-        # Append citations to comments or notes (since schema might not have citations field yet)
-        # Or ideally we add it. For now, let's put it in notes formatted nicely if no field exists.
-        # But wait, user wanted citations.
-        # I'll enable citations in 'rejection_reasons' if rejected, or just append to notes.
-        
-        citations = result.get("citations", [])
+        # A refusal leaves parsed unset; raising falls back to the hard-rule decision
+        message = response.choices[0].message
+        if message.parsed is None:
+            raise ValueError(f"No structured output from LLM (refusal: {message.refusal})")
+        result = message.parsed
+        
+        # Update Decision Object (enum values are the uppercase strings)
+        decision.decision = DecisionType(result.final_decision)
+        
+        decision.notes = result.reasoning
+        decision.next_steps = result.next_steps
+        
+        # Append citations to notes (ClaimDecision has no citations field)
+        citations = result.citations
         if citations:
             citation_text = "\n\nPolicy Citations:\n" + "\n".join([f"- {c}" for c in citations])
             decision.notes += citation_text
@@ -430,3 +426,15 @@ class AdjudicationEngine:
         
         return llm_decision
 
+
+@lru_cache(maxsize=1)
+def get_adjudication_engine() -> AdjudicationEngine:
+    """
+    Shared AdjudicationEngine for this process
+    
+    Built lazily on first use (loading policy terms hits the database) and
+    reused afterwards. The engine keeps no per-claim state, so API handlers
+    and Celery tasks can share it. Policy terms are read once per process;
+    call get_adjudication_engine.cache_clear() after changing them.
+    """
+    return AdjudicationEngine()
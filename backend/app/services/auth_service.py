@@ -1,14 +1,20 @@
 """
 Authentication service using PolicyHolder model (no separate User table)
 """
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 from jose import JWTError, jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import asyncio
 import hashlib
-from sqlalchemy.orm import Session
+import hmac
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.models import PolicyHolder
 from app.schemas.auth import TokenData
+from app.services.jwt_cache import get_cached_token, cache_token
 from app.config import settings
 
 # JWT settings
@@ -16,21 +22,38 @@ SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Argon2id hasher (C implementation, releases the GIL while hashing)
+password_hasher = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+
+def _is_legacy_hash(hashed_password: str) -> bool:
+    """Accounts created before Argon2 store an unsalted SHA256 hexdigest"""
+    return not hashed_password.startswith("$argon2")
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash"""
-    return get_password_hash(plain_password) == hashed_password
+    """Verify password against hash (Argon2id, or legacy SHA256)"""
+    if _is_legacy_hash(hashed_password):
+        # Constant-time compare so the legacy path leaks no prefix timing
+        return hmac.compare_digest(hashlib.sha256(plain_password.encode()).hexdigest(), hashed_password)
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True for legacy SHA256 hashes or Argon2 hashes with outdated parameters"""
+    return _is_legacy_hash(hashed_password) or password_hasher.check_needs_rehash(hashed_password)
 
 def get_password_hash(password: str) -> str:
-    """Hash password using SHA256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash password using Argon2id"""
+    return password_hasher.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -47,26 +70,66 @@ def verify_token(token: str) -> Optional[TokenData]:
     except JWTError:
         return None
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[PolicyHolder]:
-    """Authenticate user with email and password using PolicyHolder"""
-    policy_holder = db.query(PolicyHolder).filter(PolicyHolder.email == email).first()
-    if not policy_holder:
+def verify_token_cached(token: str) -> Optional[TokenData]:
+    """Verify JWT token, reusing a recent verification of the same token"""
+    token_data = get_cached_token(token)
+    if token_data is not None:
+        return token_data
+    
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
         return None
-    if not policy_holder.hashed_password:
-        return None  # No password set
-    if not verify_password(password, policy_holder.hashed_password):
+    email: str = payload.get("sub")
+    if email is None:
         return None
-    if not policy_holder.is_active:
-        return None  # Account disabled
-    return policy_holder
+    
+    token_data = TokenData(email=email)
+    if payload.get("exp") is not None:
+        cache_token(token, token_data, float(payload["exp"]))
+    return token_data
+
+async def _get_credentials(db: AsyncSession, email: str) -> Optional[Tuple[Optional[str], bool]]:
+    """(hashed_password, is_active) for an email; None if no such account"""
+    # Read fresh on every login (password and is_active changes apply
+    # at once); two columns, no ORM object to build
+    row = (await db.execute(
+        select(PolicyHolder.hashed_password, PolicyHolder.is_active).where(PolicyHolder.email == email)
+    )).first()
+    if row is None:
+        return None
+    return row.hashed_password, row.is_active
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> bool:
+    """Check email and password against the policy holder's credentials"""
+    credentials = await _get_credentials(db, email)
+    if credentials is None:
+        return False
+    hashed_password, is_active = credentials
+    if not hashed_password:
+        return False  # No password set
+    # Hash verification is CPU-bound; keep it off the event loop
+    if not await asyncio.to_thread(verify_password, password, hashed_password):
+        return False
+    if not is_active:
+        return False  # Account disabled
+    if password_needs_rehash(hashed_password):
+        # Upgrade legacy hashes transparently on successful login
+        new_hash = await asyncio.to_thread(get_password_hash, password)
+        await db.execute(
+            update(PolicyHolder).where(PolicyHolder.email == email).values(hashed_password=new_hash)
+        )
+        await db.commit()
+    return True
 
-def get_user_by_email(db: Session, email: str) -> Optional[PolicyHolder]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[PolicyHolder]:
     """Get policy holder by email"""
-    return db.query(PolicyHolder).filter(PolicyHolder.email == email).first()
+    result = await db.execute(select(PolicyHolder).where(PolicyHolder.email == email))
+    return result.scalar_one_or_none()
 
-def create_user(db: Session, email: str, password: str, full_name: str, role: str = "user") -> PolicyHolder:
+async def create_user(db: AsyncSession, email: str, password: str, full_name: str, role: str = "user") -> PolicyHolder:
     """Create new policy holder with auth credentials (not used - use policy_holders API instead)"""
-    hashed_password = get_password_hash(password)
+    hashed_password = await asyncio.to_thread(get_password_hash, password)
     policy_holder = PolicyHolder(
         email=email,
         hashed_password=hashed_password,
@@ -74,6 +137,5 @@ def create_user(db: Session, email: str, password: str, full_name: str, role: st
         is_active=True
     )
     db.add(policy_holder)
-    db.commit()
-    db.refresh(policy_holder)
+    await db.commit()
     return policy_holder
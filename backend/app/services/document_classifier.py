@@ -27,6 +27,15 @@ class DocumentClassifier:
         "result", "normal range", "nabl", "cap accreditation"
     ]
     
+    # Filename hints, compiled once and checked in priority order (a name
+    # matching both "rx" and "bill" is a prescription). One C-level scan per
+    # type instead of a Python-level `in` test per keyword.
+    FILENAME_PATTERNS = (
+        ("prescription", re.compile("prescription|presc|rx")),
+        ("bill", re.compile("bill|invoice|receipt")),
+        ("report", re.compile("report|test|lab")),
+    )
+    
     @staticmethod
     def classify_by_filename(filename: str) -> Optional[str]:
         """
@@ -40,12 +49,9 @@ class DocumentClassifier:
         """
         filename_lower = filename.lower()
         
-        if any(keyword in filename_lower for keyword in ["prescription", "rx", "presc"]):
-            return "prescription"
-        elif any(keyword in filename_lower for keyword in ["bill", "invoice", "receipt"]):
-            return "bill"
-        elif any(keyword in filename_lower for keyword in ["report", "test", "lab"]):
-            return "report"
+        for doc_type, pattern in DocumentClassifier.FILENAME_PATTERNS:
+            if pattern.search(filename_lower):
+                return doc_type
         
         return None
     
@@ -7,27 +7,53 @@ Production-Ready Document Processor with GPT-4o Vision
 - Error handling
 """
 import base64
+import io
 import json
 import logging
+import os
 import time
+from functools import lru_cache
 from typing import Dict, Any
 
 from app.services.minio_service import get_storage_service
 # from app.services.rag_service import RAGService  # DISABLED - Not needed for OCR
-from app.services.redis_rate_limiter import RedisRateLimiter, log_usage_async, _calculate_cost
+from app.services.redis_rate_limiter import get_rate_limiter, log_usage_async, _calculate_cost
 from app.config import settings
 from app.utils.database import SessionLocal
 from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Phone uploads the Vision API cannot read; transcoded to JPEG before encoding
+HEIC_EXTENSIONS = {".heic", ".heif"}
+
+
+def _transcode_heic_to_jpeg(file_data: bytes) -> bytes:
+    """
+    Decode HEIC/HEIF bytes and re-encode as JPEG
+    
+    CPU-heavy, so it only ever runs here in the Celery worker, never in an
+    API handler. Needs the optional pillow-heif package.
+    """
+    try:
+        import pillow_heif
+    except ImportError:
+        raise ValueError("HEIC upload received but pillow-heif is not installed")
+    from PIL import Image
+    
+    pillow_heif.register_heif_opener()
+    with Image.open(io.BytesIO(file_data)) as image:
+        out = io.BytesIO()
+        image.convert("RGB").save(out, format="JPEG", quality=90)
+    return out.getvalue()
+
 
 class DocumentProcessor:
     def __init__(self):
         self.minio_service = get_storage_service()
         # self.rag_service = RAGService()  # DISABLED - Sentence transformer permission error
         self.rag_service = None  # Temporarily disabled
-        self.rate_limiter = RedisRateLimiter()
+        self.rate_limiter = get_rate_limiter()
         
         # Initialize AsyncOpenAI client for async/await support
         if not settings.OPENAI_API_KEY:
@@ -102,6 +128,12 @@ class DocumentProcessor:
                 )
                 raise
 
+            # HEIC → JPEG (worker-side; the upload endpoints never decode images)
+            if os.path.splitext(object_name)[1].lower() in HEIC_EXTENSIONS:
+                logger.info("🖼️  Transcoding HEIC to JPEG...")
+                file_data = _transcode_heic_to_jpeg(file_data)
+                logger.info(f"✅ Transcoded to JPEG: {len(file_data)} bytes")
+
             # STEP 3: ENCODE to Base64 (Secure transmission to OpenAI)
             logger.info(f"🔐 Encoding to base64...")
             base64_image = base64.b64encode(file_data).decode('utf-8')
@@ -522,3 +554,15 @@ Extract whatever data is available following the schema structure.
         except Exception as e:
             logger.warning(f"⚠️  Failed to store in Qdrant: {e}")
             # Don't fail the entire process if Qdrant fails
+
+
+@lru_cache(maxsize=1)
+def get_document_processor() -> DocumentProcessor:
+    """
+    Shared DocumentProcessor for this process
+    
+    Built once so the AsyncOpenAI client (and its HTTP connection pool),
+    MinIO client and rate limiter are reused across documents instead of
+    being re-created for every task.
+    """
+    return DocumentProcessor()
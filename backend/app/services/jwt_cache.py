@@ -0,0 +1,45 @@
+"""
+Short-lived cache of verified JWTs
+
+Dashboards poll protected endpoints with the same bearer token, so the
+signature check and decode are repeated identically on every request.
+Verified tokens are remembered for a few seconds, keyed by a blake2b digest
+of the token (the raw token is never stored). The short TTL bounds how long
+a revoked or expired token can still be accepted.
+"""
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.schemas.auth import TokenData
+
+_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+_lock = threading.Lock()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def get_cached_token(token: str) -> Optional[TokenData]:
+    """Return cached token data if the token was verified recently and has not expired"""
+    key = _token_key(token)
+    with _lock:
+        entry = _cache.get(key)
+    if entry is None:
+        return None
+    
+    token_data, expires_at = entry
+    if expires_at <= time.time():
+        return None
+    return token_data
+
+
+def cache_token(token: str, token_data: TokenData, expires_at: float) -> None:
+    """Remember a verified token until the TTL or its own `exp`, whichever is first"""
+    key = _token_key(token)
+    with _lock:
+        _cache[key] = (token_data, expires_at)
@@ -2,7 +2,8 @@
 Production-grade MinIO storage service with interface abstraction
 """
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from typing import BinaryIO
+from functools import lru_cache
 from minio import Minio
 from minio.error import S3Error
 from datetime import timedelta
@@ -218,15 +219,16 @@ class MinIOStorageService(StorageInterface):
             logger.error(f"[MINIO] Error generating download URL: {str(e)}")
             raise
 
-# Global storage service instance (singleton pattern)
-_storage_service: Optional[MinIOStorageService] = None
-
+@lru_cache(maxsize=1)
 def get_storage_service() -> StorageInterface:
-    """Get global storage service instance (lazy initialization)"""
-    global _storage_service
-    if _storage_service is None:
-        _storage_service = MinIOStorageService()
-    return _storage_service
+    """
+    Get global storage service instance (lazy initialization)
+    
+    Built once per process: both Minio clients, their credentials and the
+    pinned region are resolved here, so presigning a URL afterwards is a
+    local HMAC computation with no network round-trip.
+    """
+    return MinIOStorageService()
 
 # Convenience alias - DO NOT instantiate here, use get_storage_service() instead
 # This allows .env to be loaded before MinIO client is created
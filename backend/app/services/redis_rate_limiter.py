@@ -22,11 +22,16 @@ from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from typing import Optional
 from contextlib import contextmanager
+from functools import lru_cache
 
 from app.config import settings
+from app.utils.cache import invalidate
 
 logger = logging.getLogger(__name__)
 
+# Cached /usage/stats response; dropped whenever a usage row is written
+USAGE_STATS_CACHE_KEY = "usage:stats:v1"
+
 
 class RedisRateLimiter:
     """
@@ -202,16 +207,8 @@ class RedisRateLimiter:
         daily_requests = self._get_count("ratelimit:openai:rpd", now, 86400)
         
         return {
-            "minute": {
-                "requests": minute_requests,
-                "tokens": minute_tokens,
-                "rpm_limit": self.rpm_limit,
-                "tpm_limit": self.tpm_limit
-            },
-            "day": {
-                "requests": daily_requests,
-                "rpd_limit": self.rpd_limit
-            }
+            "minute": {"requests": minute_requests, "tokens": minute_tokens},
+            "day": {"requests": daily_requests}
         }
     
     # ===== REDIS HELPERS (Sliding Window Algorithm) =====
@@ -305,6 +302,17 @@ class RedisRateLimiter:
             logger.error(f"Redis error in reset_limits: {e}")
 
 
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RedisRateLimiter:
+    """
+    Shared RedisRateLimiter for this process
+    
+    Built on first use (the constructor pings Redis) and reused; the
+    redis-py client inside is a pooled, thread-safe connection.
+    """
+    return RedisRateLimiter()
+
+
 # ===== ASYNC AUDIT LOGGING (Database) =====
 
 def log_usage_async(
@@ -358,6 +366,9 @@ def log_usage_async(
     db.add(log)
     db.commit()
     
+    # Surface rate-limit spikes on the dashboard immediately
+    invalidate(USAGE_STATS_CACHE_KEY)
+    
     logger.info(f"💰 Usage logged to DB:")
     logger.info(f"   - Document: {document_id}")
     logger.info(f"   - Model: {model}")
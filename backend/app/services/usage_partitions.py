@@ -0,0 +1,57 @@
+"""
+Usage Log Partition Maintenance
+
+api_usage_logs is range-partitioned by month on timestamp. The partitioning
+migration pre-created a few months ahead; this keeps that window rolling so
+new rows never fall into the default partition.
+"""
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Months to keep pre-created past the current one (matches the migration)
+MONTHS_AHEAD = 3
+
+
+def _next_month(month: date) -> date:
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def ensure_usage_log_partitions(db: Session, months_ahead: int = MONTHS_AHEAD) -> List[str]:
+    """
+    Create any missing monthly partitions from this month through `months_ahead`
+
+    Returns:
+        Names of the partitions created
+    """
+    existing = set(db.execute(text(
+        "SELECT inhrelid::regclass::text FROM pg_inherits "
+        "WHERE inhparent = 'api_usage_logs'::regclass"
+    )).scalars().all())
+    
+    created = []
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(months_ahead + 1):
+        next_month = _next_month(month)
+        name = f"api_usage_logs_{month:%Y_%m}"
+        if name not in existing:
+            try:
+                db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF api_usage_logs "
+                    f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+                ))
+                db.commit()
+                created.append(name)
+            except Exception as e:
+                # Typically rows for this month already sit in the default
+                # partition; they have to be moved out by hand first
+                db.rollback()
+                logger.error(f"❌ Could not create partition {name}: {e}")
+        month = next_month
+    
+    return created
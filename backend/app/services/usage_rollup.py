@@ -0,0 +1,76 @@
+"""
+Hourly Usage Rollup
+
+Folds APIUsageLog rows into APIUsageHourly. Each run recomputes
+whole hours from the log and upserts them, so it is idempotent and safe to
+run concurrently or repeatedly.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.usage_log import APIUsageLog, APIUsageHourly
+
+# document_type is part of the rollup key, so it cannot be NULL
+UNKNOWN_DOCUMENT_TYPE = "unknown"
+
+FAILED_STATUSES = ("failed", "error")
+
+
+def status_aggregates():
+    """
+    Per-outcome aggregates over APIUsageLog rows, for one scan
+
+    COUNT/SUM ... FILTER (WHERE status ...): every bucket comes out of the
+    same pass instead of one query per status.
+    """
+    success = APIUsageLog.status == "success"
+    return (
+        func.count().filter(success).label("requests"),
+        func.coalesce(func.sum(APIUsageLog.total_tokens).filter(success), 0).label("tokens"),
+        func.coalesce(func.sum(APIUsageLog.cost_usd).filter(success), 0.0).label("cost_usd"),
+        func.count().filter(APIUsageLog.status == "rate_limited").label("rate_limited"),
+        func.count().filter(APIUsageLog.status.in_(FAILED_STATUSES)).label("failed")
+    )
+
+
+def hour_start(moment: datetime) -> datetime:
+    """Truncate a datetime to the start of its hour"""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def rollup_usage_hours(db: Session, since: Optional[datetime] = None) -> int:
+    """
+    Recompute hourly usage rows from `since` (default: start of the previous hour)
+
+    Returns:
+        Number of (hour, document_type) rows upserted
+    """
+    if since is None:
+        since = hour_start(datetime.now(timezone.utc)) - timedelta(hours=1)
+    
+    # Truncate in UTC regardless of the session time zone (IST is +05:30,
+    # which would shift every bucket by half an hour)
+    hour = func.date_trunc("hour", APIUsageLog.timestamp, "UTC")
+    document_type = func.coalesce(APIUsageLog.document_type, UNKNOWN_DOCUMENT_TYPE)
+    source = select(
+        hour,
+        document_type,
+        *status_aggregates()
+    ).where(
+        APIUsageLog.timestamp >= hour_start(since)
+    ).group_by(hour, document_type)
+    
+    columns = ["requests", "tokens", "cost_usd", "rate_limited", "failed"]
+    stmt = insert(APIUsageHourly).from_select(["hour", "document_type", *columns], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[APIUsageHourly.hour, APIUsageHourly.document_type],
+        set_={column: stmt.excluded[column] for column in columns}
+    )
+    
+    result = db.execute(stmt)
+    db.commit()
+    return result.rowcount
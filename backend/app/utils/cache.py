@@ -0,0 +1,78 @@
+"""
+Redis Response Cache
+
+Short-TTL caching for read-heavy, staleness-tolerant endpoints (dashboards
+that poll). Keys follow {domain}:{identifier}:v{n}[:{params}] so a payload
+shape change only needs a version bump.
+
+A Redis outage never fails a request: reads fall through to the handler and
+writes are skipped.
+"""
+import functools
+import logging
+from typing import Callable, Optional
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Async client for API handlers; sync client for invalidation from the
+# worker's synchronous code paths. Both connect lazily.
+redis_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+_sync_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+def redis_cached(key_fn: Callable[..., Optional[str]], ttl: int):
+    """
+    Cache an async endpoint's JSON-serialisable result in Redis
+
+    Serialised with orjson (as ORJSONResponse does), so datetimes are
+    stored as RFC 3339 strings.
+
+    Args:
+        key_fn: Called with the endpoint's keyword arguments; returns the
+            cache key, or None to bypass the cache for this call
+        ttl: Seconds to keep the cached response
+
+    Usage:
+        @router.get("/usage/history")
+        @redis_cached(lambda hours, **_: f"usage:history:v1:{hours}", ttl=30)
+        async def get_usage_history(hours: int = 24, db = Depends(get_async_db)):
+            ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_fn(**kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+
+            try:
+                cached = await redis_client.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except Exception as e:
+                logger.warning(f"Cache read failed for {key}: {e}")
+
+            result = await func(*args, **kwargs)
+
+            try:
+                await redis_client.set(key, orjson.dumps(result), ex=ttl)
+            except Exception as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate(*keys: str) -> None:
+    """Drop cached responses (synchronous; safe to call from Celery tasks)"""
+    try:
+        _sync_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {keys}: {e}")
@@ -1,16 +1,54 @@
+from typing import AsyncGenerator
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+# QueuePool sizing shared by both engines (SQLite uses its own pool class).
+# pre_ping drops connections the server or a proxy closed while idle;
+# recycle replaces long-lived ones before such timeouts hit.
+_POOL_OPTIONS = {} if "sqlite" in settings.DATABASE_URL else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": True,
+}
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
+    **_POOL_OPTIONS
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects keep their loaded/just-written values after
+# commit, so returning them from a handler does not trigger a reload SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+def _async_database_url(url: str) -> str:
+    """Map the sync DATABASE_URL onto its asyncio driver (asyncpg / aiosqlite)"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+# Async engine for request handlers: awaiting the database keeps handlers on
+# the event loop instead of bouncing through FastAPI's threadpool.
+# The sync engine above stays for Celery workers and Session-based routers.
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    **_POOL_OPTIONS
+)
+
+# Async session factory
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
@@ -22,3 +60,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# Dependency to get an async database session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
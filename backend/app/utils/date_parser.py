@@ -10,7 +10,7 @@ Handles various date formats from LLM/OCR output:
 
 Prevents 500 errors from fragile date parsing.
 """
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Optional, Union
 import logging
 from dateutil import parser as dateutil_parser
@@ -18,6 +18,16 @@ from dateutil import parser as dateutil_parser
 logger = logging.getLogger(__name__)
 
 
+def utc_now() -> datetime:
+    """
+    Current UTC time as a naive datetime
+    
+    Drop-in for the deprecated datetime.utcnow(); naive because the
+    DateTime columns are TIMESTAMP WITHOUT TIME ZONE.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def parse_date_robust(
     date_str: Optional[str],
     default: Optional[datetime] = None
@@ -2,7 +2,7 @@
 Atomic ID Generation using PostgreSQL Sequences
 
 This module provides thread-safe, race-condition-free ID generation
-for Claims, Policy Holders, and Documents using PostgreSQL sequences.
+for Claims, Policy Holders, Documents, and Dependents using PostgreSQL sequences.
 
 Benefits:
 - O(1) performance (no table scans)
@@ -11,7 +11,22 @@ Benefits:
 - Database-level guarantees
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, bindparam, Integer
+
+# Statements are built once at import time and reused for every call, so
+# SQLAlchemy's compiled cache hits and the driver sees identical SQL text.
+_NEXT_CLAIM_ID = text("SELECT nextval('claim_id_seq')")
+_NEXT_POLICY_HOLDER_ID = text("SELECT nextval('policy_holder_id_seq')")
+_NEXT_DOCUMENT_ID = text("SELECT nextval('document_id_seq')")
+_NEXT_DEPENDENT_ID = text("SELECT nextval('dependent_id_seq')")
+_CURRENT_CLAIM_SEQ = text("SELECT currval('claim_id_seq')")
+_CURRENT_POLICY_HOLDER_SEQ = text("SELECT currval('policy_holder_id_seq')")
+_RESET_CLAIM_SEQ = text("SELECT setval('claim_id_seq', :value, false)").bindparams(
+    bindparam("value", type_=Integer)
+)
+_RESET_POLICY_HOLDER_SEQ = text("SELECT setval('policy_holder_id_seq', :value, false)").bindparams(
+    bindparam("value", type_=Integer)
+)
 
 
 def generate_claim_id(db: Session) -> str:
@@ -29,7 +44,7 @@ def generate_claim_id(db: Session) -> str:
     Returns:
         Next claim ID in format CLMxxxxxx
     """
-    result = db.execute(text("SELECT nextval('claim_id_seq')"))
+    result = db.execute(_NEXT_CLAIM_ID)
     next_id = result.scalar()
     return f"CLM{next_id:06d}"
 
@@ -49,7 +64,7 @@ def generate_policy_holder_id(db: Session) -> str:
     Returns:
         Next policy holder ID in format PHxxxxxx
     """
-    result = db.execute(text("SELECT nextval('policy_holder_id_seq')"))
+    result = db.execute(_NEXT_POLICY_HOLDER_ID)
     next_id = result.scalar()
     return f"PH{next_id:06d}"
 
@@ -72,20 +87,40 @@ def generate_document_id(db: Session) -> str:
     Returns:
         Next document ID in format DOCxxxxxx
     """
-    result = db.execute(text("SELECT nextval('document_id_seq')"))
+    result = db.execute(_NEXT_DOCUMENT_ID)
     next_id = result.scalar()
     return f"DOC{next_id:06d}"
 
 
+def generate_dependent_id(db: Session) -> str:
+    """
+    Generate next dependent ID using PostgreSQL sequence
+    
+    Format: DEP000001, DEP000002, ...
+    
+    Thread-safe and race-condition-free.
+    O(1) performance - no table scans.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Next dependent ID in format DEPxxxxxx
+    """
+    result = db.execute(_NEXT_DEPENDENT_ID)
+    next_id = result.scalar()
+    return f"DEP{next_id:06d}"
+
+
 def get_current_claim_sequence(db: Session) -> int:
     """Get current value of claim_id_seq without incrementing"""
-    result = db.execute(text("SELECT currval('claim_id_seq')"))
+    result = db.execute(_CURRENT_CLAIM_SEQ)
     return result.scalar()
 
 
 def get_current_policy_holder_sequence(db: Session) -> int:
     """Get current value of policy_holder_id_seq without incrementing"""
-    result = db.execute(text("SELECT currval('policy_holder_id_seq')"))
+    result = db.execute(_CURRENT_POLICY_HOLDER_SEQ)
     return result.scalar()
 
 
@@ -95,7 +130,7 @@ def reset_claim_sequence(db: Session, value: int = 1):
     
     WARNING: Use only for testing or data migration
     """
-    db.execute(text(f"SELECT setval('claim_id_seq', {value}, false)"))
+    db.execute(_RESET_CLAIM_SEQ, {"value": value})
     db.commit()
 
 
@@ -105,5 +140,5 @@ def reset_policy_holder_sequence(db: Session, value: int = 1):
     
     WARNING: Use only for testing or data migration
     """
-    db.execute(text(f"SELECT setval('policy_holder_id_seq', {value}, false)"))
+    db.execute(_RESET_POLICY_HOLDER_SEQ, {"value": value})
     db.commit()
@@ -0,0 +1,36 @@
+"""
+Eager-Loading Query Helpers
+
+Listing queries that serialise relationships must batch them: one extra
+SELECT ... WHERE key IN (...) per relationship (selectinload) instead of a
+lazy load per row. Under AsyncSession a lazy load is not just slow but an
+error (MissingGreenlet), so relationship access in a listing goes through a
+helper here.
+"""
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.models import Claim, Document
+from app.models.usage_log import APIUsageLog
+
+
+async def recent_usage_with_claims(db: AsyncSession, limit: int) -> Sequence[APIUsageLog]:
+    """
+    Most recent usage logs with their document, claim and policy holder loaded
+
+    Three batched lookups in total, however many logs are returned.
+    """
+    return (await db.execute(
+        select(APIUsageLog)
+        .options(
+            selectinload(APIUsageLog.document)
+            .selectinload(Document.claim)
+            .selectinload(Claim.policy_holder)
+        )
+        .order_by(APIUsageLog.timestamp.desc())
+        .limit(limit)
+    )).scalars().all()
+
@@ -61,11 +61,48 @@ celery_app.conf.update(
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     
+    # OCR tasks are long and CPU/LLM-bound: each worker process reserves
+    # only the task it is running, so concurrent OCR is capped at the
+    # pool size (--concurrency) and queued documents go to whichever
+    # process frees up first instead of waiting behind a busy one
+    worker_prefetch_multiplier=1,
+    
     # Result backend settings
     result_expires=3600,  # Results expire after 1 hour
+    
+    # Periodic jobs (run the worker with --beat, or a separate `celery beat`)
+    beat_schedule={
+        'rollup-usage-hourly': {
+            'task': 'rollup_usage_hourly_task',
+            'schedule': 300.0  # Every 5 minutes
+        },
+        'ensure-usage-log-partitions': {
+            'task': 'ensure_usage_log_partitions_task',
+            'schedule': 86400.0  # Daily
+        }
+    },
 )
 
 
+_event_loop = None
+
+
+def run_async(coro):
+    """
+    Run a coroutine on this worker process's event loop
+    
+    The loop is created on first use and kept open, so cached async clients
+    (e.g. the shared DocumentProcessor's AsyncOpenAI pool) stay bound to a
+    live loop across tasks. Created lazily so each forked pool process gets
+    its own.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop.run_until_complete(coro)
+
+
 @celery_app.task(name="process_document_task", bind=True, max_retries=3)
 def process_document_task(self, file_id: str, file_path: str, document_type: str):
     """
@@ -84,7 +121,7 @@ def process_document_task(self, file_id: str, file_path: str, document_type: str
         logger.info(f"🚀 Starting OCR processing for {file_id}")
         
         # Import here to avoid circular dependencies
-        from app.services.document_processor import DocumentProcessor
+        from app.services.document_processor import get_document_processor
         from app.models.models import Document
         from app.utils.database import SessionLocal
         from datetime import datetime
@@ -102,15 +139,10 @@ def process_document_task(self, file_id: str, file_path: str, document_type: str
             
             # Process with GPT-4o Vision
             logger.info(f"🔍 Processing with GPT-4o Vision: {file_id}")
-            processor = DocumentProcessor()
-            
-            # Create event loop for async operation
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
+            processor = get_document_processor()
+            result = run_async(
                 processor.process_document(file_id, file_path, document_type)
             )
-            loop.close()
             
             # Update document with results
             document.ocr_text = json.dumps(result.get("extracted_data", {}))
@@ -192,7 +224,7 @@ def adjudicate_claim_task(self, claim_id: str):
         Decision summary
     """
     from app.models.models import Claim, PolicyHolder, Document, ClaimDecision
-    from app.services.adjudication_engine import AdjudicationEngine
+    from app.services.adjudication_engine import get_adjudication_engine
     from app.utils.database import SessionLocal
     from datetime import datetime
     
@@ -237,7 +269,7 @@ def adjudicate_claim_task(self, claim_id: str):
                 "policy_holder_id": policy_holder.policy_holder_id,
                 "policy_holder_name": policy_holder.policy_holder_name,
                 "dob": policy_holder.dob,
-                "policy_status": policy_holder.policy_status.value if hasattr(policy_holder.policy_status, 'value') else str(policy_holder.policy_status),
+                "policy_status": policy_holder.policy_status_str,
                 "policy_start_date": policy_holder.policy_start_date.isoformat() if policy_holder.policy_start_date else None,
                 "join_date": policy_holder.join_date.isoformat() if policy_holder.join_date else None,
                 "annual_limit": policy_holder.annual_limit,
@@ -247,8 +279,8 @@ def adjudicate_claim_task(self, claim_id: str):
                 "pre_existing_conditions": policy_holder.pre_existing_conditions or []
             }
             
-            # Run adjudication with full context
-            engine = AdjudicationEngine()
+            # Shared per-process engine (policy terms loaded once)
+            engine = get_adjudication_engine()
             
             logger.info(f"📋 Loaded policy terms: {engine.policy_terms.get('policy_id', 'Unknown')}")
             
@@ -260,8 +292,7 @@ def adjudicate_claim_task(self, claim_id: str):
             }
             
             # Run adjudication with full context
-            engine = AdjudicationEngine()
-            decision = asyncio.run(engine.adjudicate_claim(claim_id, adjudication_context))
+            decision = run_async(engine.adjudicate_claim(claim_id, adjudication_context))
             
             # Check if decision already exists
             existing_decision = db.query(ClaimDecision).filter(
@@ -279,7 +310,6 @@ def adjudicate_claim_task(self, claim_id: str):
                 # Save new decision
                 db.add(decision)
                 db.commit()
-                db.refresh(decision)
                 logger.info(f"✅ Created decision for claim {claim_id}: {decision.decision}")
             
             # Update claim status
@@ -362,6 +392,46 @@ def adjudicate_claim_task(self, claim_id: str):
             return {"status": "failed", "error": str(e)}
 
 
+@celery_app.task(name="rollup_usage_hourly_task")
+def rollup_usage_hourly_task():
+    """
+    Refresh the previous and current hour of the api_usage_hourly rollup
+    
+    Runs every 5 minutes from beat; each run recomputes those hours from
+    api_usage_logs, so missed or duplicate runs are harmless.
+    """
+    from app.services.usage_rollup import rollup_usage_hours
+    from app.utils.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        rows = rollup_usage_hours(db)
+        logger.info(f"📊 Rolled up {rows} hourly usage rows")
+        return {"status": "success", "rows": rows}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="ensure_usage_log_partitions_task")
+def ensure_usage_log_partitions_task():
+    """
+    Keep monthly api_usage_logs partitions created ahead of time
+    
+    Runs daily from beat; existing partitions are left alone.
+    """
+    from app.services.usage_partitions import ensure_usage_log_partitions
+    from app.utils.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        created = ensure_usage_log_partitions(db)
+        if created:
+            logger.info(f"🗂️  Created usage log partitions: {', '.join(created)}")
+        return {"status": "success", "created": created}
+    finally:
+        db.close()
+
+
 @worker_ready.connect
 def on_worker_ready(sender, **kwargs):
     """Called when Celery worker is ready"""